@@ -1,12 +1,31 @@
 # pcbuilder package
 
+import importlib
+
 __version__ = "0.1.0"
 
 # Export search algorithms for easy access
-from .search_algorithms import (
-    binary_search_by_price,
-    binary_search_exact,
-    binary_search_range,
-    linear_search_by_price,
-    compare_search_algorithms
-)
+# Loaded on first use (PEP 562) so "import pcbuilder" stays cheap for code
+# that only needs other submodules
+_LAZY_EXPORTS = {
+    'binary_search_by_price': 'search_algorithms',
+    'binary_search_exact': 'search_algorithms',
+    'binary_search_range': 'search_algorithms',
+    'linear_search_by_price': 'search_algorithms',
+    'compare_search_algorithms': 'search_algorithms',
+}
+
+
+def __getattr__(name):
+    # Import the submodule that defines name and cache the result on the package
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -1,7 +1,7 @@
 # Advanced Authentication and Authorization System
 # Implements role-based access control (RBAC) with multiple user levels
 from enum import Enum
-from typing import Optional, Dict, List, Callable
+from typing import Optional, Dict, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
 import functools
@@ -25,7 +25,7 @@ class UserRole(Enum):
         return NotImplemented
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     # Defines a specific permission with metadata
     name: str
@@ -39,8 +39,16 @@ class Permission:
 
 class PermissionRegistry:
     # Singleton registry of all application permissions
+    # Permissions are fixed once the module has loaded, so per-role results
+    # are cached and only rebuilt when register() changes the set
+    #
+    # Each permission gets one bit, and each role a mask of the bits it is
+    # granted, so a check is a single integer AND
     _instance = None
     _permissions: Dict[str, Permission] = {}
+    _permission_bits: Dict[str, int] = {}
+    _role_masks: Dict[UserRole, int] = {}
+    _role_permissions: Dict[UserRole, Tuple[Permission, ...]] = {}
     
     def __new__(cls):
         if cls._instance is None:
@@ -50,6 +58,17 @@ class PermissionRegistry:
     def register(self, permission: Permission) -> None:
         # Register a new permission
         self._permissions[permission.name] = permission
+        if permission.name not in self._permission_bits:
+            self._permission_bits[permission.name] = 1 << len(self._permission_bits)
+        
+        # Rebuild the role masks in place so code holding a reference sees the change
+        for role in UserRole:
+            mask = 0
+            for p in self._permissions.values():
+                if p.check(role):
+                    mask |= self._permission_bits[p.name]
+            self._role_masks[role] = mask
+        self._role_permissions.clear()
     
     def get(self, name: str) -> Optional[Permission]:
         # Get a permission by name
@@ -57,14 +76,15 @@ class PermissionRegistry:
     
     def check(self, permission_name: str, user_role: UserRole) -> bool:
         # Check if a role has a specific permission
-        perm = self.get(permission_name)
-        if perm is None:
-            return False
-        return perm.check(user_role)
+        return bool(self._role_masks.get(user_role, 0) & self._permission_bits.get(permission_name, 0))
     
-    def get_all_for_role(self, role: UserRole) -> List[Permission]:
+    def get_all_for_role(self, role: UserRole) -> Tuple[Permission, ...]:
         # Get all permissions available to a role
-        return [p for p in self._permissions.values() if p.check(role)]
+        permissions = self._role_permissions.get(role)
+        if permissions is None:
+            permissions = tuple(p for p in self._permissions.values() if p.check(role))
+            self._role_permissions[role] = permissions
+        return permissions
 
 
 # Initialize permission registry and define permissions
@@ -108,8 +128,12 @@ PERMISSIONS = {
 for perm in PERMISSIONS.values():
     _registry.register(perm)
 
+# Build the per-role permission lists now, while importing
+for role in UserRole:
+    _registry.get_all_for_role(role)
+
 
-@dataclass
+@dataclass(slots=True)
 class User:
     # Represents an authenticated user with role and permissions
     user_id: Optional[int]
@@ -121,7 +145,7 @@ class User:
         # Check if user has a specific permission
         return _registry.check(permission_name, self.role)
     
-    def get_permissions(self) -> List[Permission]:
+    def get_permissions(self) -> Tuple[Permission, ...]:
         # Get all permissions available to this user
         return _registry.get_all_for_role(self.role)
     
@@ -138,26 +162,13 @@ class User:
         return self.has_permission('LOAD_BUILD')
 
 
-class GuestUser(User):
-    # Singleton guest user instance
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = object.__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        # Only initialize once
-        if not GuestUser._initialized:
-            super().__init__(
-                user_id=None,
-                username="Guest",
-                role=UserRole.GUEST,
-                created_at=datetime.now()
-            )
-            GuestUser._initialized = True
+# Shared guest user, created once when the module loads
+GUEST_USER = User(
+    user_id=None,
+    username="Guest",
+    role=UserRole.GUEST,
+    created_at=datetime.now()
+)
 
 
 def requires_permission(permission_name: str):
@@ -168,16 +179,27 @@ def requires_permission(permission_name: str):
     # def save_build(self, build_data):
     # # Only executes if user has SAVE_BUILD permission
     # ...
+    
+    # Look the permission up once when the method is decorated, so a typo
+    # fails at import time instead of on the first call
+    permission_bit = _registry._permission_bits.get(permission_name)
+    if permission_bit is None:
+        raise ValueError(f"Unknown permission: {permission_name}")
+    role_masks = _registry._role_masks
+    
     def decorator(func: Callable):
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             # Get current user from the object
-            current_user = getattr(self, 'current_user', None)
+            try:
+                current_user = self.current_user
+            except AttributeError:
+                current_user = None
             
             if current_user is None:
                 raise PermissionError("No authenticated user")
             
-            if not current_user.has_permission(permission_name):
+            if not role_masks.get(current_user.role, 0) & permission_bit:
                 raise PermissionError(
                     f"User '{current_user.username}' (role: {current_user.role.name}) "
                     f"does not have permission: {permission_name}"
@@ -196,15 +218,22 @@ def requires_role(minimum_role: UserRole):
     # def standard_feature(self):
     # # Only executes if user is STANDARD level
     # ...
+    
+    # Compare plain ints in the wrapper instead of going through UserRole.__lt__
+    minimum_value = minimum_role.value
+    
     def decorator(func: Callable):
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            current_user = getattr(self, 'current_user', None)
+            try:
+                current_user = self.current_user
+            except AttributeError:
+                current_user = None
             
             if current_user is None:
                 raise PermissionError("No authenticated user")
             
-            if current_user.role < minimum_role:
+            if current_user.role.value < minimum_value:
                 raise PermissionError(
                     f"User '{current_user.username}' (role: {current_user.role.name}) "
                     f"requires minimum role: {minimum_role.name}"
@@ -227,7 +256,7 @@ class SessionManager:
     
     def login_guest(self) -> User:
         # Login as guest user
-        self._current_user = GuestUser()
+        self._current_user = GUEST_USER
         return self._current_user
     
     def login_user(self, user_id: int, username: str, role: UserRole = UserRole.STANDARD) -> User:
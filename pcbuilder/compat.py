@@ -1,4 +1,27 @@
-from typing import Dict, List, Tuple
+import functools
+from typing import Dict, List, Optional, Tuple
+
+# Shared stand-in for parts without an attributes dict (never modified)
+_EMPTY = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_form_factors(supported: str) -> frozenset:
+    # Split a case's comma-separated form factor list into a set
+    # Cached, since the same few case strings come up again and again
+    return frozenset(supported.split(","))
+
+
+def _to_int(value) -> Optional[int]:
+    # Numeric attributes are converted to int when parts are loaded, so this is
+    # normally just a type check. Only values that are still text (e.g. builds
+    # saved by older versions) get parsed. Returns None if it isn't a number
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
 
 def check_cpu_mobo(cpu: Dict, mobo: Dict) -> Tuple[bool, str]:
@@ -8,8 +31,10 @@ def check_cpu_mobo(cpu: Dict, mobo: Dict) -> Tuple[bool, str]:
         return True, "CPU or motherboard missing - cannot check socket"
     
     # Extract socket types from the component attributes
-    cpu_socket = cpu.get("attributes", {}).get("socket")
-    mobo_socket = mobo.get("attributes", {}).get("socket")
+    cpu_attrs = cpu.get("attributes") or _EMPTY
+    mobo_attrs = mobo.get("attributes") or _EMPTY
+    cpu_socket = cpu_attrs.get("socket")
+    mobo_socket = mobo_attrs.get("socket")
     
     # Sockets must match exactly (e.g., both must be "AM4" or "LGA1700")
     if cpu_socket != mobo_socket:
@@ -24,46 +49,46 @@ def check_ram_mobo(ram: Dict, mobo: Dict) -> Tuple[bool, str]:
     if ram is None or mobo is None:
         return True, "RAM or motherboard missing - cannot check memory type"
     
+    ram_attrs = ram.get("attributes") or _EMPTY
+    mobo_attrs = mobo.get("attributes") or _EMPTY
+    
     # Check memory type (DDR4 vs DDR5 - they're physically different and not interchangeable)
-    ram_type = ram.get("attributes", {}).get("memory_type")
-    mobo_mem = mobo.get("attributes", {}).get("memory_type")
+    ram_type = ram_attrs.get("memory_type")
+    mobo_mem = mobo_attrs.get("memory_type")
     if ram_type != mobo_mem:
         return False, f"RAM type {ram_type} does not match motherboard supported {mobo_mem}"
     
     # Check if we're trying to install more RAM sticks than the motherboard has slots for
-    # Using try-except because not all parts have these attributes in the database
-    try:
-        slots = int(mobo.get("attributes", {}).get("memory_slots", 0))
-        sticks = int(ram.get("attributes", {}).get("sticks", 1))
-        if sticks > slots:
-            return False, f"RAM sticks ({sticks}) exceed motherboard slots ({slots})"
-    except Exception:
-        pass  # If we can't parse the numbers, just skip this check
+    # If either number can't be read, just skip this check
+    slots = _to_int(mobo_attrs.get("memory_slots", 0))
+    sticks = _to_int(ram_attrs.get("sticks", 1))
+    if slots is not None and sticks is not None and sticks > slots:
+        return False, f"RAM sticks ({sticks}) exceed motherboard slots ({slots})"
     
     return True, "RAM appears compatible with motherboard"
 
 
 def check_case_mobo_case_gpu(mobo: Dict, case: Dict, gpu: Dict) -> List[Tuple[bool, str]]:
     results = []
+    case_attrs = (case.get("attributes") or _EMPTY) if case else _EMPTY
     # form factor
     if mobo and case:
-        mobo_form = mobo.get("attributes", {}).get("form_factor")
-        case_form = case.get("attributes", {}).get("supported_form_factors")
-        if case_form and mobo_form not in case_form.split(","):
+        mobo_form = (mobo.get("attributes") or _EMPTY).get("form_factor")
+        case_form = case_attrs.get("supported_form_factors")
+        if case_form and mobo_form not in _parse_form_factors(case_form):
             results.append((False, f"Motherboard form factor {mobo_form} not supported by case ({case_form})"))
         else:
             results.append((True, "Motherboard fits case form factor"))
     # GPU length
     if gpu and case:
-        try:
-            gpu_len = int(gpu.get("attributes", {}).get("length_mm", 0))
-            max_len = int(case.get("attributes", {}).get("max_gpu_length_mm", 0))
-            if gpu_len > max_len:
-                results.append((False, f"GPU length {gpu_len}mm exceeds case max {max_len}mm"))
-            else:
-                results.append((True, "GPU fits in case"))
-        except Exception:
+        gpu_len = _to_int((gpu.get("attributes") or _EMPTY).get("length_mm", 0))
+        max_len = _to_int(case_attrs.get("max_gpu_length_mm", 0))
+        if gpu_len is None or max_len is None:
             results.append((True, "GPU / case length unknown - skipping check"))
+        elif gpu_len > max_len:
+            results.append((False, f"GPU length {gpu_len}mm exceeds case max {max_len}mm"))
+        else:
+            results.append((True, "GPU fits in case"))
     return results
 
 
@@ -75,24 +100,20 @@ def check_psu_wattage(parts: Dict[str, Dict], headroom: float = 1.25) -> Tuple[b
         return False, "No PSU selected"
     
     # Get the PSU's max wattage rating
-    try:
-        psu_w = int(psu.get("attributes", {}).get("wattage", 0))
-    except Exception:
+    psu_w = _to_int((psu.get("attributes") or _EMPTY).get("wattage", 0))
+    if psu_w is None:
         return False, "PSU wattage unknown"
     
     # Calculate total power draw by adding up all components
     # (CPU + GPU are the biggest power consumers, usually)
-    total_draw = 0
-    for k, p in parts.items():
-        if p is None:
-            continue
-        if k == "PSU":  # Don't count the PSU itself
-            continue
-        try:
-            # Each component has a power_draw attribute in watts
-            total_draw += int(p.get("attributes", {}).get("power_draw", 0))
-        except Exception:
-            pass  # If power_draw is missing, just skip it
+    # Each component has a power_draw attribute in watts. The PSU itself isn't
+    # counted, and any power_draw that can't be read is skipped
+    draws = (
+        _to_int((p.get("attributes") or _EMPTY).get("power_draw", 0))
+        for k, p in parts.items()
+        if p is not None and k != "PSU"
+    )
+    total_draw = sum(draw for draw in draws if draw is not None)
     
     # Apply the 25% headroom for safety and efficiency
     required = int(total_draw * headroom)
@@ -103,10 +124,17 @@ def check_psu_wattage(parts: Dict[str, Dict], headroom: float = 1.25) -> Tuple[b
 
 
 def run_full_check(parts: Dict[str, Dict]) -> List[Tuple[str, bool, str]]:
-    results = []
-    results.append(("cpu_socket",) + check_cpu_mobo(parts.get("CPU"), parts.get("Motherboard")))
-    results.append(("ram_mobo",) + check_ram_mobo(parts.get("RAM"), parts.get("Motherboard")))
-    for idx, res in enumerate(check_case_mobo_case_gpu(parts.get("Motherboard"), parts.get("Case"), parts.get("GPU"))):
-        results.append((f"case_check_{idx}", res[0], res[1]))
-    results.append(("psu_wattage",) + check_psu_wattage(parts))
+    # Unpack each (ok, message) result straight into its final tuple rather than
+    # building it by concatenating ("rule_id",) + result
+    mobo = parts.get("Motherboard")
+    ok, message = check_cpu_mobo(parts.get("CPU"), mobo)
+    results = [("cpu_socket", ok, message)]
+    ok, message = check_ram_mobo(parts.get("RAM"), mobo)
+    results.append(("ram_mobo", ok, message))
+    results.extend(
+        (f"case_check_{idx}", ok, message)
+        for idx, (ok, message) in enumerate(check_case_mobo_case_gpu(mobo, parts.get("Case"), parts.get("GPU")))
+    )
+    ok, message = check_psu_wattage(parts)
+    results.append(("psu_wattage", ok, message))
     return results
@@ -5,15 +5,23 @@ Implements: Singleton pattern, Encapsulation, Abstraction
 import sqlite3
 from pathlib import Path
 import json
-import secrets
-import string
-from typing import List, Optional, Dict, Any
+import hashlib
+import hmac
+import os
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
-from threading import Lock
-from .custom_hash import my_custom_sha256_hash
+from threading import Lock, RLock, local
+from functools import lru_cache
 from .models import Component, ComponentFactory, Build
 
 
+# JSON stored in the database is written without spaces after "," and ":"
+# so rows are smaller and there is less text to parse when loading them.
+# The encoder/decoder are created once instead of on every call
+_dump_json = json.JSONEncoder(separators=(',', ':')).encode
+_load_json = json.JSONDecoder().decode
+
+
 class DatabaseManager:
     """
     Singleton Database Manager
@@ -24,28 +32,52 @@ class DatabaseManager:
     __instance: Optional['DatabaseManager'] = None
     __lock: Lock = Lock()
     
+    # PBKDF2 rounds for new password hashes (stored with each hash, so it can be raised later)
+    __HASH_ITERATIONS: int = 200_000
+    __HASH_PREFIX: str = "pbkdf2_sha256"
+    __SHARE_KEY_ATTEMPTS: int = 5
+    __SHARE_KEY_CHARS: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    
     def __new__(cls, db_path: Optional[Path] = None):
         """Ensure only one instance exists (Singleton pattern)"""
         if cls.__instance is None:
             with cls.__lock:
                 if cls.__instance is None:
-                    cls.__instance = super().__new__(cls)
+                    # Set up the instance before publishing it, so no other
+                    # thread can see a half-initialised manager
+                    instance = super().__new__(cls)
+                    instance.__setup(db_path)
+                    cls.__instance = instance
         return cls.__instance
     
     def __init__(self, db_path: Optional[Path] = None):
-        """Initialize database manager"""
-        # Only initialize once
-        if not hasattr(self, '_initialized'):
-            if db_path is None:
-                db_path = Path(__file__).resolve().parent.parent / "pcbuilder.db"
-            
-            # Private attributes
-            self.__db_path: Path = db_path
-            self.__connection: Optional[sqlite3.Connection] = None
-            self._initialized = True
-            
-            # Initialize database schema
-            self.__initialize_schema()
+        """Initialize database manager (setup runs once, in __new__)"""
+    
+    def __setup(self, db_path: Optional[Path]) -> None:
+        """Initialize the single instance (private method)"""
+        if db_path is None:
+            db_path = Path(__file__).resolve().parent.parent / "pcbuilder.db"
+        
+        # Private attributes
+        self.__db_path: Path = db_path
+        self.__local = local()  # Each thread keeps its own connection here
+        self.__connections: List[sqlite3.Connection] = []  # Every open connection, for close()
+        self.__connections_lock: Lock = Lock()
+        self.__write_lock: RLock = RLock()  # One writer at a time across all connections
+        
+        # The parts catalogue rarely changes, so components read from it are
+        # cached until the next write to parts (see __clear_component_caches).
+        # Every caller gets the same cached objects, so they must not be modified.
+        # The generation goes up on every clear; a read that overlapped a write
+        # sees a different generation and doesn't store its (possibly old) rows
+        self.__cache_lock: Lock = Lock()
+        self.__cache_generation: int = 0
+        self.__category_cache: Dict[str, List[Component]] = {}
+        self.__category_dicts_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self.__component_cache = lru_cache(maxsize=256)(self.__fetch_component_by_id)
+        
+        # Initialize database schema
+        self.__initialize_schema()
     
     @property
     def db_path(self) -> Path:
@@ -53,11 +85,23 @@ class DatabaseManager:
         return self.__db_path
     
     def __get_connection(self) -> sqlite3.Connection:
-        """Get database connection (private method)"""
-        # Add timeout to handle OneDrive sync issues
-        conn = sqlite3.connect(self.__db_path, timeout=30.0)
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
+        """Get this thread's database connection, opening it on first use (private method)"""
+        # Each thread reuses one long-lived connection, so connecting and setting
+        # the pragmas happens once per thread rather than on every query.
+        # With WAL, readers on different connections don't block each other
+        conn = getattr(self.__local, 'connection', None)
+        if conn is None:
+            # Add timeout to handle OneDrive sync issues
+            conn = sqlite3.connect(self.__db_path, timeout=30.0, check_same_thread=False)
+            # Per-connection settings: WAL only needs a sync at checkpoints,
+            # reads come from a memory map and temp tables stay in memory
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")
+            self.__local.connection = conn
+            with self.__connections_lock:
+                self.__connections.append(conn)
         return conn
     
     def __initialize_schema(self) -> None:
@@ -65,6 +109,31 @@ class DatabaseManager:
         conn = self.__get_connection()
         cur = conn.cursor()
         
+        # Enable WAL mode for better concurrent access
+        # This is stored in the database file, so it only has to be set once here
+        cur.execute("PRAGMA journal_mode=WAL")
+        
+        # Run all DDL in one transaction so the schema is rewritten and
+        # synced to disk once, instead of once per statement
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            self.__create_tables(cur)
+            self.__migrate_legacy_columns(cur)
+            self.__migrate_build_parts(cur)
+            self.__create_indexes(cur)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        # Gather table statistics the first time so the query planner
+        # knows how selective each index is. close() keeps them up to date
+        cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cur.fetchone() is None:
+            cur.execute("ANALYZE")
+    
+    def __create_tables(self, cur: sqlite3.Cursor) -> None:
+        """Create any missing tables (private method)"""
         # Create parts table
         cur.execute("""
             CREATE TABLE IF NOT EXISTS parts (
@@ -82,7 +151,7 @@ class DatabaseManager:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
                 password_hash TEXT NOT NULL,
-                role INTEGER DEFAULT 1,
+                role INTEGER NOT NULL DEFAULT 1,
                 created_at TEXT NOT NULL
             )
         """)
@@ -100,24 +169,132 @@ class DatabaseManager:
             )
         """)
         
-        # Create indexes for performance
+        # Create build_parts table: one row per filled slot of a build, so a
+        # build's components are loaded by joining with parts instead of
+        # decoding the JSON copy in builds.parts_json.
+        # The price is kept so a saved build shows what it cost when saved
         cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_parts_category 
-            ON parts(category)
+            CREATE TABLE IF NOT EXISTS build_parts (
+                build_id INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                component_id TEXT NOT NULL,
+                price REAL NOT NULL,
+                PRIMARY KEY (build_id, category),
+                FOREIGN KEY (build_id) REFERENCES builds(id) ON DELETE CASCADE,
+                FOREIGN KEY (component_id) REFERENCES parts(id)
+            ) WITHOUT ROWID
         """)
-        
+    
+    def __get_table_columns(self, cur: sqlite3.Cursor, table: str) -> frozenset:
+        """Get all column names of a table from one metadata read (private method)"""
+        cur.execute(f"PRAGMA table_info({table})")
+        return frozenset(row[1] for row in cur.fetchall())
+    
+    def __migrate_legacy_columns(self, cur: sqlite3.Cursor) -> None:
+        """Add columns missing from databases created by older versions (private method)"""
+        # Fetch each table's columns once and test membership against the set
+        user_columns = self.__get_table_columns(cur, 'users')
+        build_columns = self.__get_table_columns(cur, 'builds')
+        
+        if 'role' not in user_columns:
+            # NOT NULL with a constant default fills existing rows without an UPDATE
+            cur.execute("ALTER TABLE users ADD COLUMN role INTEGER NOT NULL DEFAULT 1")
+        
+        if 'share_key' not in build_columns:
+            cur.execute("ALTER TABLE builds ADD COLUMN share_key TEXT")
+    
+    def __migrate_build_parts(self, cur: sqlite3.Cursor) -> None:
+        """Fill build_parts for builds saved before it existed (private method)"""
+        # Done in SQL with json_each, so old builds never have to be loaded
+        # into Python. Builds that already have rows (or invalid JSON) are skipped
         cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_builds_user 
-            ON builds(user_id)
+            INSERT OR IGNORE INTO build_parts (build_id, category, component_id, price)
+            SELECT b.id, slot.key, json_extract(slot.value, '$.id'), json_extract(slot.value, '$.price')
+            FROM (
+                SELECT id, parts_json FROM builds
+                WHERE json_valid(parts_json)
+                  AND id NOT IN (SELECT build_id FROM build_parts)
+            ) AS b, json_each(b.parts_json) AS slot
+            WHERE slot.type = 'object'
+              AND json_extract(slot.value, '$.id') IS NOT NULL
+              AND json_extract(slot.value, '$.price') IS NOT NULL
+        """)
+    
+    def __create_indexes(self, cur: sqlite3.Cursor) -> None:
+        """Create indexes for performance (private method)"""
+        # Covering index: category lookups are answered from the index alone
+        # without a second lookup into the parts table for every row.
+        # It starts with category, so the old single column index is redundant
+        cur.execute("DROP INDEX IF EXISTS idx_parts_category")
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_parts_cat_cover 
+            ON parts(category, id, name, price, attributes)
         """)
         
+        # A user's builds come back in creation order straight from the index
+        cur.execute("DROP INDEX IF EXISTS idx_builds_user")
         cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_builds_share_key 
-            ON builds(share_key)
+            CREATE INDEX IF NOT EXISTS idx_builds_user_created 
+            ON builds(user_id, created_at)
         """)
         
-        conn.commit()
-        conn.close()
+        # Older versions indexed share_key without UNIQUE under this name as well
+        cur.execute("DROP INDEX IF EXISTS idx_share_key")
+        
+        # Tables created with "share_key TEXT UNIQUE" already have a unique
+        # index from SQLite, so a second one would only slow down writes
+        if self.__has_unique_share_key(cur):
+            cur.execute("DROP INDEX IF EXISTS idx_builds_share_key")
+            return
+        
+        # share_key was added later by ALTER TABLE, without UNIQUE. Only shared
+        # builds have a key, so index just those rows. The index is UNIQUE so
+        # save_build can rely on it to reject a duplicate key.
+        # Replace the plain index that older versions created
+        cur.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = 'idx_builds_share_key'"
+        )
+        row = cur.fetchone()
+        if row is not None and ('WHERE' not in row[0].upper() or 'UNIQUE' not in row[0].upper()):
+            cur.execute("DROP INDEX idx_builds_share_key")
+            row = None
+        
+        if row is None:
+            # Nothing stopped two builds getting the same key before, and the
+            # unique index can't be created while any do
+            self.__replace_duplicate_share_keys(cur)
+            cur.execute("""
+                CREATE UNIQUE INDEX idx_builds_share_key 
+                ON builds(share_key) WHERE share_key IS NOT NULL
+            """)
+    
+    def __replace_duplicate_share_keys(self, cur: sqlite3.Cursor) -> None:
+        """Give a new share key to every build whose key an older build already has (private method)"""
+        # The oldest build keeps the key, so links shared first still work
+        cur.execute("""
+            SELECT id FROM builds AS b
+            WHERE share_key IS NOT NULL
+              AND EXISTS (SELECT 1 FROM builds AS o WHERE o.share_key = b.share_key AND o.id < b.id)
+        """)
+        for (build_id,) in cur.fetchall():
+            share_key = self.__generate_share_key()
+            cur.execute("SELECT 1 FROM builds WHERE share_key = ?", (share_key,))
+            while cur.fetchone() is not None:
+                share_key = self.__generate_share_key()
+                cur.execute("SELECT 1 FROM builds WHERE share_key = ?", (share_key,))
+            cur.execute("UPDATE builds SET share_key = ? WHERE id = ?", (share_key, build_id))
+    
+    def __has_unique_share_key(self, cur: sqlite3.Cursor) -> bool:
+        """Check if the builds table itself declares share_key UNIQUE (private method)"""
+        # index_list rows are (seq, name, unique, origin, partial) - origin 'u'
+        # means the index comes from a UNIQUE constraint in CREATE TABLE
+        cur.execute("PRAGMA index_list(builds)")
+        constraint_indexes = [row[1] for row in cur.fetchall() if row[2] and row[3] == 'u']
+        for index_name in constraint_indexes:
+            cur.execute(f"PRAGMA index_info({index_name})")
+            if [row[2] for row in cur.fetchall()] == ['share_key']:
+                return True
+        return False
     
     # === Component Management Methods ===
     
@@ -125,26 +302,49 @@ class DatabaseManager:
         """Add a component to the database"""
         try:
             conn = self.__get_connection()
-            cur = conn.cursor()
             
             comp_dict = component.to_dict()
-            cur.execute(
-                """INSERT OR REPLACE INTO parts 
-                   (id, name, category, price, attributes) 
-                   VALUES (?, ?, ?, ?, ?)""",
-                (comp_dict['id'], comp_dict['name'], comp_dict['category'],
-                 comp_dict['price'], json.dumps(comp_dict['attributes']))
-            )
+            # "with conn" commits on success and rolls back on error
+            with self.__write_lock, conn:
+                conn.execute(
+                    """INSERT OR REPLACE INTO parts 
+                       (id, name, category, price, attributes) 
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (comp_dict['id'], comp_dict['name'], comp_dict['category'],
+                     comp_dict['price'], _dump_json(comp_dict['attributes']))
+                )
+            self.__clear_component_caches()
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Error adding component: {e}")
             return False
     
+    def __clear_component_caches(self) -> None:
+        """Forget cached components after parts has changed (private method)"""
+        with self.__cache_lock:
+            self.__cache_generation += 1
+            self.__category_cache.clear()
+            self.__category_dicts_cache.clear()
+            self.__component_cache.cache_clear()
+    
+    def __store_in_cache(self, cache: Dict[str, Any], key: str, value: Any, generation: int) -> None:
+        """Cache a value read during the given generation, unless parts has changed since (private method)"""
+        with self.__cache_lock:
+            if generation == self.__cache_generation:
+                cache[key] = value
+    
     def get_component_by_id(self, component_id: str) -> Optional[Component]:
-        """Get a specific component by ID"""
+        """
+        Get a specific component by ID
+        The component is cached and shared with other callers, so don't modify it
+        """
+        # The generation is part of the cache key, so a component read while
+        # parts was being changed is never returned after the change
+        return self.__component_cache(component_id, self.__cache_generation)
+    
+    def __fetch_component_by_id(self, component_id: str, generation: int) -> Optional[Component]:
+        """Read a component from the database, behind the LRU cache (private method)"""
         conn = self.__get_connection()
         cur = conn.cursor()
         
@@ -153,62 +353,120 @@ class DatabaseManager:
             (component_id,)
         )
         row = cur.fetchone()
-        conn.close()
         
         if row is None:
             return None
         
         return ComponentFactory.create_component(
             row[0], row[1], row[2], row[3],
-            json.loads(row[4]) if row[4] else {}
+            _load_json(row[4]) if row[4] else {}
         )
     
+    def __components_from_cursor(self, cur: sqlite3.Cursor) -> List[Component]:
+        """Create components from (id, name, category, price, attributes) rows (private method)"""
+        # Look the functions up once rather than on every row
+        create_component = ComponentFactory.create_component
+        is_known_category = ComponentFactory.is_known_category
+        load_json = _load_json
+        
+        components = []
+        for component_id, name, category, price, attributes in cur:
+            if not is_known_category(category):
+                print(f"Error loading component {component_id}: Unknown component category: {category}")
+                continue
+            try:
+                components.append(create_component(
+                    component_id, name, category, price,
+                    load_json(attributes) if attributes else {}
+                ))
+            except ValueError as e:
+                # Broken attributes JSON - report the row and carry on with the rest
+                print(f"Error loading component {component_id}: {e}")
+        
+        return components
+    
     def get_all_components(self) -> List[Component]:
         """Get all components from database"""
         conn = self.__get_connection()
         cur = conn.cursor()
         
         cur.execute("SELECT id, name, category, price, attributes FROM parts")
-        rows = cur.fetchall()
-        conn.close()
-        
-        components = []
-        for row in rows:
-            try:
-                component = ComponentFactory.create_component(
-                    row[0], row[1], row[2], row[3],
-                    json.loads(row[4]) if row[4] else {}
-                )
-                components.append(component)
-            except Exception as e:
-                print(f"Error loading component {row[0]}: {e}")
-        
-        return components
+        return self.__components_from_cursor(cur)
     
-    def get_components_by_category(self, category: str) -> List[Component]:
-        """Get all components of a specific category"""
+    def get_all_component_dicts(self, category: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every component as a dictionary (same layout as Component.to_dict)
+        Reads straight from the cursor without creating Component objects,
+        so callers that only need dictionaries can filter as they go.
+        Pass a category to let SQLite pick those rows (using the category index)
+        """
         conn = self.__get_connection()
         cur = conn.cursor()
         
-        cur.execute(
-            "SELECT id, name, category, price, attributes FROM parts WHERE category = ?",
-            (category,)
-        )
-        rows = cur.fetchall()
-        conn.close()
+        if category is None:
+            cur.execute("SELECT id, name, category, price, attributes FROM parts")
+        else:
+            # ORDER BY rowid keeps the same order as the unfiltered query
+            cur.execute(
+                "SELECT id, name, category, price, attributes FROM parts WHERE category = ? ORDER BY rowid",
+                (category,)
+            )
         
-        components = []
-        for row in rows:
+        loads = _load_json
+        is_known_category = ComponentFactory.is_known_category
+        convert = ComponentFactory.convert_numeric_attributes
+        for component_id, name, category, price, attributes in cur:
+            if not is_known_category(category):
+                print(f"Error loading component {component_id}: Unknown component category: {category}")
+                continue
             try:
-                component = ComponentFactory.create_component(
-                    row[0], row[1], row[2], row[3],
-                    json.loads(row[4]) if row[4] else {}
-                )
-                components.append(component)
-            except Exception as e:
-                print(f"Error loading component {row[0]}: {e}")
+                attributes = convert(loads(attributes)) if attributes else {}
+            except ValueError as e:
+                # Report and skip a row with broken attributes, like get_all_components
+                print(f"Error loading component {component_id}: {e}")
+                continue
+            yield {
+                'id': component_id,
+                'name': name,
+                'category': category,
+                'price': price,
+                'attributes': attributes
+            }
+    
+    def get_component_dicts_by_category(self, category: str) -> List[Dict[str, Any]]:
+        """
+        Get all components of a category as dictionaries, cached per category
+        The same list is returned on every call until parts changes, so callers
+        must not modify it (copy it first to sort or filter in place)
+        """
+        parts = self.__category_dicts_cache.get(category)
+        if parts is None:
+            generation = self.__cache_generation
+            parts = list(self.get_all_component_dicts(category))
+            self.__store_in_cache(self.__category_dicts_cache, category, parts, generation)
+        return parts
+    
+    def get_components_by_category(self, category: str) -> List[Component]:
+        """
+        Get all components of a specific category
+        The list is a new copy, but the components in it are cached and
+        shared with other callers, so don't modify them
+        """
+        components = self.__category_cache.get(category)
+        if components is None:
+            generation = self.__cache_generation
+            conn = self.__get_connection()
+            cur = conn.cursor()
+            
+            cur.execute(
+                "SELECT id, name, category, price, attributes FROM parts WHERE category = ?",
+                (category,)
+            )
+            components = self.__components_from_cursor(cur)
+            self.__store_in_cache(self.__category_cache, category, components, generation)
         
-        return components
+        # Copy the list so callers can sort or filter it without changing the cache
+        return list(components)
     
     def load_components_from_json(self, json_path: Path) -> int:
         """Load components from JSON file, returns count of loaded components"""
@@ -216,19 +474,41 @@ class DatabaseManager:
             with open(json_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            count = 0
+            # Validate every item first, then insert them all in one go
+            # Rows are built straight from the JSON items - creating a Component
+            # only to turn it back into a dict would just repeat the same work
+            rows = []
             for item in data:
                 try:
-                    component = ComponentFactory.create_component(
-                        item['id'], item['name'], item['category'],
-                        item['price'], item.get('attributes', {})
-                    )
-                    if self.add_component(component):
-                        count += 1
+                    category = item['category']
+                    if not ComponentFactory.is_known_category(category):
+                        raise ValueError(f"Unknown component category: {category}")
+                    rows.append((item['id'], item['name'], category,
+                                 item['price'], _dump_json(item.get('attributes', {}))))
                 except Exception as e:
                     print(f"Error loading component {item.get('id', 'unknown')}: {e}")
             
-            return count
+            conn = self.__get_connection()
+            with self.__write_lock:
+                try:
+                    # One transaction for the whole file instead of a commit per part
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(
+                        """INSERT OR REPLACE INTO parts 
+                           (id, name, category, price, attributes) 
+                           VALUES (?, ?, ?, ?, ?)""",
+                        rows
+                    )
+                    # A bulk load changes the shape of parts completely, so
+                    # refresh its statistics for the query planner
+                    conn.execute("ANALYZE parts")
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                self.__clear_component_caches()
+            
+            return len(rows)
         except Exception as e:
             print(f"Error loading JSON file: {e}")
             return 0
@@ -236,8 +516,35 @@ class DatabaseManager:
     # === User Management Methods ===
     
     def __hash_password(self, password: str) -> str:
-        """Hash password using custom SHA256 (private method)"""
-        return my_custom_sha256_hash(password)
+        """Hash password with salted PBKDF2-HMAC-SHA256 (private method)"""
+        # Stored as "pbkdf2_sha256$iterations$salt$hash" so every user has their own salt
+        # (os.urandom is what secrets.token_bytes uses, without importing secrets)
+        salt = os.urandom(16)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, self.__HASH_ITERATIONS)
+        return f"{self.__HASH_PREFIX}${self.__HASH_ITERATIONS}${salt.hex()}${digest.hex()}"
+    
+    def __is_legacy_hash(self, stored_hash: str) -> bool:
+        """Check if a stored hash is an old unsalted SHA256 digest (private method)"""
+        return not stored_hash.startswith(self.__HASH_PREFIX + "$")
+    
+    def __verify_password(self, password: str, stored_hash: str) -> bool:
+        """Check a password against a stored hash in constant time (private method)"""
+        if self.__is_legacy_hash(stored_hash):
+            # Accounts created before salting used a plain SHA256 digest.
+            # Imported here since only old accounts need it
+            from .custom_hash import my_custom_sha256_hash
+            return hmac.compare_digest(my_custom_sha256_hash(password), stored_hash)
+        
+        try:
+            _, iterations, salt_hex, hash_hex = stored_hash.split("$")
+            expected = bytes.fromhex(hash_hex)
+            digest = hashlib.pbkdf2_hmac(
+                'sha256', password.encode('utf-8'), bytes.fromhex(salt_hex), int(iterations)
+            )
+        except ValueError:
+            return False  # Corrupt hash - treat as a failed login
+        # Compare the raw 32 byte digests rather than their hex text
+        return hmac.compare_digest(digest, expected)
     
     def create_user(self, username: str, password: str, role: int = 1) -> Optional[int]:
         """Create a new user account"""
@@ -249,19 +556,16 @@ class DatabaseManager:
         
         try:
             conn = self.__get_connection()
-            cur = conn.cursor()
             
             password_hash = self.__hash_password(password)
-            cur.execute(
-                """INSERT INTO users (username, password_hash, role, created_at) 
-                   VALUES (?, ?, ?, ?)""",
-                (username, password_hash, role, datetime.now().isoformat())
-            )
+            with self.__write_lock, conn:
+                cur = conn.execute(
+                    """INSERT INTO users (username, password_hash, role, created_at) 
+                       VALUES (?, ?, ?, ?)""",
+                    (username, password_hash, role, datetime.now().isoformat())
+                )
             
-            user_id = cur.lastrowid
-            conn.commit()
-            conn.close()
-            return user_id
+            return cur.lastrowid
         except sqlite3.IntegrityError:
             return None  # Username already exists
     
@@ -275,16 +579,28 @@ class DatabaseManager:
             (username,)
         )
         row = cur.fetchone()
-        conn.close()
         
         if row is None:
             return None
         
         user_id, stored_hash, role = row
-        if self.__hash_password(password) == stored_hash:
-            return (user_id, role)
+        if not self.__verify_password(password, stored_hash):
+            return None
+        
+        # Upgrade old unsalted hashes now that we know the password
+        if self.__is_legacy_hash(stored_hash):
+            try:
+                conn = self.__get_connection()
+                new_hash = self.__hash_password(password)
+                with self.__write_lock, conn:
+                    conn.execute(
+                        "UPDATE users SET password_hash = ? WHERE id = ?",
+                        (new_hash, user_id)
+                    )
+            except sqlite3.Error as e:
+                print(f"Error upgrading password hash: {e}")
         
-        return None
+        return (user_id, role)
     
     def get_user_info(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user information"""
@@ -296,7 +612,6 @@ class DatabaseManager:
             (user_id,)
         )
         row = cur.fetchone()
-        conn.close()
         
         if row is None:
             return None
@@ -312,45 +627,67 @@ class DatabaseManager:
     
     def __generate_share_key(self) -> str:
         """Generate unique share key (private method)"""
-        chars = string.ascii_uppercase + string.digits
-        return ''.join(secrets.choice(chars) for _ in range(8))
+        # Read 8 random bytes once and write the number out as 8 base-36 digits
+        # (A-Z, 0-9), instead of asking for a random character 8 times.
+        # 36^8 is tiny next to 2^64, so every key is as good as equally likely
+        number = int.from_bytes(os.urandom(8), 'big')
+        chars = self.__SHARE_KEY_CHARS
+        key = []
+        for _ in range(8):
+            number, digit = divmod(number, 36)
+            key.append(chars[digit])
+        return ''.join(key)
+    
+    def __insert_with_share_key(self, cur: sqlite3.Cursor, sql: str, params: Dict[str, Any]) -> str:
+        """Run an INSERT into builds with a fresh :share_key, returns the key (private method)"""
+        # The unique index rejects a key that is already taken, so just try
+        # again with a new one (with 36^8 possible keys a clash is very unlikely)
+        for attempt in range(self.__SHARE_KEY_ATTEMPTS):
+            share_key = self.__generate_share_key()
+            try:
+                cur.execute(sql, {**params, 'share_key': share_key})
+                return share_key
+            except sqlite3.IntegrityError as e:
+                # Any other constraint (e.g. a missing user_id) fails the same
+                # way with every key, so only a clashing share key is retried
+                if 'builds.share_key' not in str(e) or attempt == self.__SHARE_KEY_ATTEMPTS - 1:
+                    raise
     
     def save_build(self, build: Build) -> tuple[int, str]:
         """Save a build to database, returns (build_id, share_key)"""
         conn = self.__get_connection()
-        cur = conn.cursor()
-        
-        # Generate unique share key
-        share_key = self.__generate_share_key()
-        while True:
-            cur.execute("SELECT id FROM builds WHERE share_key = ?", (share_key,))
-            if cur.fetchone() is None:
-                break
-            share_key = self.__generate_share_key()
-        
-        build.share_key = share_key
         
         # Serialize components
+        components = build.get_all_components()
         parts_dict = {}
-        for category, component in build.get_all_components().items():
+        for category, component in components.items():
             if component is not None:
                 parts_dict[category] = component.to_dict()
             else:
                 parts_dict[category] = None
         
-        cur.execute(
-            """INSERT INTO builds (user_id, name, parts_json, created_at, share_key)
-               VALUES (?, ?, ?, ?, ?)""",
-            (build.user_id, build.name, json.dumps(parts_dict),
-             datetime.now().isoformat(), share_key)
-        )
+        with self.__write_lock, conn:
+            cur = conn.cursor()
+            
+            share_key = self.__insert_with_share_key(
+                cur,
+                """INSERT INTO builds (user_id, name, parts_json, created_at, share_key)
+                   VALUES (:user_id, :name, :parts_json, :created_at, :share_key)""",
+                {'user_id': build.user_id, 'name': build.name,
+                 'parts_json': _dump_json(parts_dict),
+                 'created_at': datetime.now().isoformat()}
+            )
+            build_id = cur.lastrowid
+            
+            cur.executemany(
+                "INSERT INTO build_parts (build_id, category, component_id, price) VALUES (?, ?, ?, ?)",
+                [(build_id, category, component.id, component.price)
+                 for category, component in components.items() if component is not None]
+            )
         
-        build_id = cur.lastrowid
+        build.share_key = share_key
         build.build_id = build_id
         
-        conn.commit()
-        conn.close()
-        
         return (build_id, share_key)
     
     def load_build(self, build_id: int) -> Optional[Build]:
@@ -364,12 +701,12 @@ class DatabaseManager:
             (build_id,)
         )
         row = cur.fetchone()
-        conn.close()
         
         if row is None:
             return None
         
-        return self.__build_from_row(row)
+        components = self.__components_for_builds(cur, "b.id = ?", (build_id,))
+        return self.__build_from_row(row, components.get(row[0]))
     
     def load_build_by_share_key(self, share_key: str) -> Optional[Build]:
         """Load a build by share key"""
@@ -382,12 +719,12 @@ class DatabaseManager:
             (share_key,)
         )
         row = cur.fetchone()
-        conn.close()
         
         if row is None:
             return None
         
-        return self.__build_from_row(row)
+        components = self.__components_for_builds(cur, "b.share_key = ?", (share_key,))
+        return self.__build_from_row(row, components.get(row[0]))
     
     def load_user_builds(self, user_id: int) -> List[Build]:
         """Load all builds for a user"""
@@ -396,24 +733,91 @@ class DatabaseManager:
         
         cur.execute(
             """SELECT id, user_id, name, parts_json, created_at, share_key 
-               FROM builds WHERE user_id = ?""",
+               FROM builds WHERE user_id = ? ORDER BY created_at""",
             (user_id,)
         )
         rows = cur.fetchall()
-        conn.close()
+        
+        # Components of every build in a single join
+        components = self.__components_for_builds(cur, "b.user_id = ?", (user_id,))
+        
+        # __build_from_row already reports and skips a build it can't load,
+        # so no extra try/except is needed around each row here
+        build_from_row = self.__build_from_row
+        get_components = components.get
         
         builds = []
         for row in rows:
-            try:
-                build = self.__build_from_row(row)
-                if build:
-                    builds.append(build)
-            except Exception as e:
-                print(f"Error loading build {row[0]}: {e}")
+            build = build_from_row(row, get_components(row[0]))
+            if build:
+                builds.append(build)
         
         return builds
     
-    def __build_from_row(self, row: tuple) -> Optional[Build]:
+    def load_user_build_summaries(self, user_id: int) -> List[Dict[str, Any]]:
+        """
+        List a user's builds without loading their components
+        Part count and total price are worked out by SQLite from build_parts,
+        so no parts_json is read or decoded for the builds list
+        """
+        conn = self.__get_connection()
+        cur = conn.cursor()
+        
+        cur.execute(
+            """SELECT b.id, b.name, COALESCE(b.created_at, ''), b.share_key,
+                      COUNT(bp.build_id), COALESCE(SUM(bp.price), 0)
+               FROM builds b
+               LEFT JOIN build_parts bp ON bp.build_id = b.id
+               WHERE b.user_id = ?
+               GROUP BY b.id
+               ORDER BY b.created_at""",
+            (user_id,)
+        )
+        
+        return [
+            {'id': build_id, 'name': name, 'created_at': created_at, 'share_key': share_key,
+             'parts_count': parts_count, 'total_price': total_price}
+            for build_id, name, created_at, share_key, parts_count, total_price in cur
+        ]
+    
+    def __components_for_builds(self, cur: sqlite3.Cursor, condition: str,
+                                params: tuple) -> Dict[int, Optional[List[Component]]]:
+        """Load components of the builds matching condition with one join (private method)"""
+        # condition is always a fixed string from this class, never user input.
+        # A build maps to None if one of its parts is no longer in the
+        # catalogue (or can't be created), so it falls back to parts_json
+        cur.execute(
+            f"""SELECT bp.build_id, bp.component_id, p.name, p.category, bp.price, p.attributes
+                FROM builds b
+                JOIN build_parts bp ON bp.build_id = b.id
+                LEFT JOIN parts p ON p.id = bp.component_id
+                WHERE {condition}""",
+            params
+        )
+        
+        create_component = ComponentFactory.create_component
+        load_json = _load_json
+        
+        components_by_build = {}
+        for build_id, component_id, name, category, price, attributes in cur:
+            components = components_by_build.setdefault(build_id, [])
+            if components is None:
+                continue
+            if name is None:
+                components_by_build[build_id] = None
+                continue
+            try:
+                components.append(create_component(
+                    component_id, name, category, price,
+                    load_json(attributes) if attributes else {}
+                ))
+            except Exception:
+                components_by_build[build_id] = None
+        
+        return components_by_build
+    
+    def __build_from_row(self, row: tuple,
+                         components: Optional[List[Component]] = None) -> Optional[Build]:
         """Convert database row to Build object (private method)"""
         try:
             build_id, user_id, name, parts_json, created_at, share_key = row
@@ -421,15 +825,22 @@ class DatabaseManager:
             build = Build(build_id, name, user_id)
             build.share_key = share_key
             
-            # Deserialize components
-            parts_dict = json.loads(parts_json)
-            for category, comp_data in parts_dict.items():
+            add_component = build.add_component
+            
+            # Components from build_parts, when they could all be loaded
+            if components is not None:
+                for component in components:
+                    add_component(component)
+                return build
+            
+            # Otherwise deserialize the stored JSON copy
+            create_component = ComponentFactory.create_component
+            for comp_data in _load_json(parts_json).values():
                 if comp_data is not None:
-                    component = ComponentFactory.create_component(
+                    add_component(create_component(
                         comp_data['id'], comp_data['name'], comp_data['category'],
                         comp_data['price'], comp_data.get('attributes', {})
-                    )
-                    build.add_component(component)
+                    ))
             
             return build
         except Exception as e:
@@ -438,32 +849,55 @@ class DatabaseManager:
     
     def import_build(self, user_id: int, share_key: str) -> Optional[tuple[int, str]]:
         """Import a build from share key to user's account"""
-        build = self.load_build_by_share_key(share_key)
-        if build is None:
-            return None
+        return self.__copy_build_row(share_key, user_id)
+    
+    def __copy_build_row(self, share_key: str, user_id: int) -> Optional[tuple[int, str]]:
+        """Copy a shared build to another user inside SQLite (private method)"""
+        # The stored parts_json and build_parts rows are copied as they are,
+        # so nothing is decoded into Components and serialized again
+        conn = self.__get_connection()
         
-        # Create a copy for the new user
-        new_build = Build(None, f"{build.name} (imported)", user_id)
-        for category, component in build.get_all_components().items():
-            if component is not None:
-                new_build.add_component(component)
+        with self.__write_lock, conn:
+            cur = conn.cursor()
+            
+            cur.execute("SELECT id FROM builds WHERE share_key = ?", (share_key,))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            source_id = row[0]
+            
+            new_share_key = self.__insert_with_share_key(
+                cur,
+                """INSERT INTO builds (user_id, name, parts_json, created_at, share_key)
+                   SELECT :user_id, name || ' (imported)', parts_json, :created_at, :share_key
+                   FROM builds WHERE id = :source_id""",
+                {'user_id': user_id, 'created_at': datetime.now().isoformat(),
+                 'source_id': source_id}
+            )
+            build_id = cur.lastrowid
+            
+            cur.execute(
+                """INSERT INTO build_parts (build_id, category, component_id, price)
+                   SELECT ?, category, component_id, price FROM build_parts WHERE build_id = ?""",
+                (build_id, source_id)
+            )
         
-        return self.save_build(new_build)
+        return (build_id, new_share_key)
     
     def delete_build(self, build_id: int, user_id: int) -> bool:
         """Delete a build (only if owned by user)"""
         try:
             conn = self.__get_connection()
-            cur = conn.cursor()
             
-            cur.execute(
-                "DELETE FROM builds WHERE id = ? AND user_id = ?",
-                (build_id, user_id)
-            )
+            with self.__write_lock, conn:
+                cur = conn.execute(
+                    "DELETE FROM builds WHERE id = ? AND user_id = ?",
+                    (build_id, user_id)
+                )
+                deleted = cur.rowcount > 0
+                if deleted:
+                    conn.execute("DELETE FROM build_parts WHERE build_id = ?", (build_id,))
             
-            deleted = cur.rowcount > 0
-            conn.commit()
-            conn.close()
             return deleted
         except Exception as e:
             print(f"Error deleting build: {e}")
@@ -484,15 +918,9 @@ class DatabaseManager:
         """)
         components_by_category = dict(cur.fetchall())
         
-        # Count total users
-        cur.execute("SELECT COUNT(*) FROM users")
-        total_users = cur.fetchone()[0]
-        
-        # Count total builds
-        cur.execute("SELECT COUNT(*) FROM builds")
-        total_builds = cur.fetchone()[0]
-        
-        conn.close()
+        # Count total users and builds together in one query
+        cur.execute("SELECT (SELECT COUNT(*) FROM users), (SELECT COUNT(*) FROM builds)")
+        total_users, total_builds = cur.fetchone()
         
         return {
             'components_by_category': components_by_category,
@@ -501,13 +929,28 @@ class DatabaseManager:
         }
     
     def close(self) -> None:
-        """Close database connection (if needed)"""
-        if self.__connection is not None:
-            self.__connection.close()
-            self.__connection = None
+        """Close every thread's database connection (if needed)"""
+        with self.__connections_lock:
+            connections = self.__connections
+            self.__connections = []
+            # A fresh local() drops every thread's closed connection, so the
+            # next call on any thread opens a new one
+            self.__local = local()
+        
+        for conn in connections:
+            # Let SQLite refresh statistics for tables that changed a lot
+            conn.execute("PRAGMA optimize")
+            conn.close()
 
 
 # Convenience function to get singleton instance
+_database_manager: Optional[DatabaseManager] = None
+
+
 def get_database_manager() -> DatabaseManager:
     """Get the singleton DatabaseManager instance"""
-    return DatabaseManager()
+    # Keep a module-level reference so repeat calls skip the constructor
+    global _database_manager
+    if _database_manager is None:
+        _database_manager = DatabaseManager()
+    return _database_manager
@@ -1,9 +1,52 @@
 # Component filtering system with unique filters for each category
 # Includes binary search optimization for price-based filtering
+import functools
+import re
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
-from .search_algorithms import binary_search_by_price, binary_search_range, linear_search_by_price
-from .models import Component, ComponentFactory
+from .search_algorithms import (
+    price_sort_order, binary_search_price_index, binary_search_range_prices, linear_search_prices
+)
+from .models import ComponentFactory
+
+
+# Shared default for parts without attributes. Writing {} as the default
+# in the filter lambdas would build a new empty dict on every call
+_EMPTY = {}
+
+# Capacity patterns, compiled once instead of looked up on every parse
+_RAM_GB_RE = re.compile(r'(\d+)GB')
+_STORAGE_TB_RE = re.compile(r'(\d+)TB')
+_STORAGE_GB_RE = re.compile(r'(\d+)GB')
+# Unlocked CPU check: one case-insensitive scan for K or X (KF and KS both
+# contain K) instead of upper-casing the name and searching it four times
+_CPU_UNLOCKED_RE = re.compile(r'[KX]', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _ram_capacity_from_name(name: str) -> int:
+    # RAM capacity in GB from a part name (e.g., '32GB (2x16GB)' -> 32)
+    # Cached by name, so the 16GB+ and 32GB+ filters (and every later
+    # filter run) parse each name only once
+    match = _RAM_GB_RE.search(name)
+    return int(match.group(1)) if match else 0
+
+
+@functools.lru_cache(maxsize=None)
+def _storage_capacity_from_text(capacity: str) -> int:
+    # Storage capacity in GB from text like '1TB' or '500GB' (cached like above)
+    capacity = capacity.upper()
+    # Check for TB
+    if "TB" in capacity:
+        match = _STORAGE_TB_RE.search(capacity)
+        if match:
+            return int(match.group(1)) * 1000  # Convert TB to GB
+    # Check for GB
+    elif "GB" in capacity:
+        match = _STORAGE_GB_RE.search(capacity)
+        if match:
+            return int(match.group(1))
+    return 0
 
 
 @dataclass
@@ -20,6 +63,12 @@ class ComponentFilters:
     
     def __init__(self):
         self.filters = self._initialize_filters()
+        # Filters by name for each category, built once here instead of on
+        # every apply_filters call (the filters never change after this)
+        self._filter_maps = {
+            category: {f.name: f for f in category_filters}
+            for category, category_filters in self.filters.items()
+        }
     
     def _initialize_filters(self) -> Dict[str, List[Filter]]:
         # Initialize all filters for each component category
@@ -40,16 +89,16 @@ class ComponentFilters:
         return [
             # Check if CPU has at least 6 cores
             Filter("6_cores", "6+ Cores", 
-                   lambda p: p.get("attributes", {}).get("cores", 0) >= 6, "CPU"),
+                   lambda p: p.get("attributes", _EMPTY).get("cores", 0) >= 6, "CPU"),
             # 8 cores for more intensive workloads
             Filter("8_cores", "8+ Cores", 
-                   lambda p: p.get("attributes", {}).get("cores", 0) >= 8, "CPU"),
+                   lambda p: p.get("attributes", _EMPTY).get("cores", 0) >= 8, "CPU"),
             # 12+ cores for professional workstations
             Filter("12_cores", "12+ Cores", 
-                   lambda p: p.get("attributes", {}).get("cores", 0) >= 12, "CPU"),
+                   lambda p: p.get("attributes", _EMPTY).get("cores", 0) >= 12, "CPU"),
             # "K" or "X" suffix means unlocked multiplier for overclocking
             Filter("unlocked", "Unlocked (K/X)", 
-                   lambda p: any(x in p.get("name", "").upper() for x in ["K", "X", "KF", "KS"]), "CPU"),
+                   lambda p: _CPU_UNLOCKED_RE.search(p.get("name", "")) is not None, "CPU"),
             # Check if CPU has integrated graphics (useful if not buying a GPU)
             Filter("integrated_gpu", "Integrated Graphics", 
                    lambda p: "F" not in p.get("name", "") or "G" in p.get("name", ""), "CPU"),
@@ -59,18 +108,18 @@ class ComponentFilters:
         # Motherboard-specific filters
         return [
             Filter("atx", "ATX Size", 
-                   lambda p: p.get("attributes", {}).get("form_factor", "").upper() == "ATX", "Motherboard"),
+                   lambda p: p.get("attributes", _EMPTY).get("form_factor", "").upper() == "ATX", "Motherboard"),
             Filter("micro_atx", "Micro-ATX Size", 
-                   lambda p: p.get("attributes", {}).get("form_factor", "").upper() == "MICRO-ATX", "Motherboard"),
+                   lambda p: p.get("attributes", _EMPTY).get("form_factor", "").upper() == "MICRO-ATX", "Motherboard"),
             Filter("mini_itx", "Mini-ITX Size", 
-                   lambda p: p.get("attributes", {}).get("form_factor", "").upper() == "MINI-ITX", "Motherboard"),
+                   lambda p: p.get("attributes", _EMPTY).get("form_factor", "").upper() == "MINI-ITX", "Motherboard"),
             Filter("wifi", "Built-in WiFi", 
                    lambda p: "wifi" in p.get("name", "").lower() or 
-                            p.get("attributes", {}).get("wifi", False), "Motherboard"),
+                            p.get("attributes", _EMPTY).get("wifi", False), "Motherboard"),
             Filter("ddr5", "DDR5 Support", 
-                   lambda p: "DDR5" in p.get("attributes", {}).get("ram_type", ""), "Motherboard"),
+                   lambda p: "DDR5" in p.get("attributes", _EMPTY).get("ram_type", ""), "Motherboard"),
             Filter("ddr4", "DDR4 Support", 
-                   lambda p: "DDR4" in p.get("attributes", {}).get("ram_type", ""), "Motherboard"),
+                   lambda p: "DDR4" in p.get("attributes", _EMPTY).get("ram_type", ""), "Motherboard"),
         ]
     
     def _get_ram_filters(self) -> List[Filter]:
@@ -85,9 +134,9 @@ class ComponentFilters:
             Filter("ddr5", "DDR5", 
                    lambda p: "DDR5" in p.get("name", ""), "RAM"),
             Filter("3200mhz", "3200 MHz+", 
-                   lambda p: p.get("attributes", {}).get("speed", 0) >= 3200, "RAM"),
+                   lambda p: p.get("attributes", _EMPTY).get("speed", 0) >= 3200, "RAM"),
             Filter("3600mhz", "3600 MHz+", 
-                   lambda p: p.get("attributes", {}).get("speed", 0) >= 3600, "RAM"),
+                   lambda p: p.get("attributes", _EMPTY).get("speed", 0) >= 3600, "RAM"),
             Filter("rgb", "RGB Lighting", 
                    lambda p: "rgb" in p.get("name", "").lower(), "RAM"),
         ]
@@ -96,11 +145,11 @@ class ComponentFilters:
         # GPU-specific filters
         return [
             Filter("8gb_vram", "8GB+ VRAM", 
-                   lambda p: p.get("attributes", {}).get("vram", 0) >= 8, "GPU"),
+                   lambda p: p.get("attributes", _EMPTY).get("vram", 0) >= 8, "GPU"),
             Filter("12gb_vram", "12GB+ VRAM", 
-                   lambda p: p.get("attributes", {}).get("vram", 0) >= 12, "GPU"),
+                   lambda p: p.get("attributes", _EMPTY).get("vram", 0) >= 12, "GPU"),
             Filter("16gb_vram", "16GB+ VRAM", 
-                   lambda p: p.get("attributes", {}).get("vram", 0) >= 16, "GPU"),
+                   lambda p: p.get("attributes", _EMPTY).get("vram", 0) >= 16, "GPU"),
             Filter("nvidia", "NVIDIA", 
                    lambda p: "nvidia" in p.get("name", "").lower() or "rtx" in p.get("name", "").lower() or "gtx" in p.get("name", "").lower(), "GPU"),
             Filter("amd", "AMD", 
@@ -113,32 +162,32 @@ class ComponentFilters:
         # PSU-specific filters
         return [
             Filter("modular", "Fully Modular", 
-                   lambda p: "fully modular" in p.get("attributes", {}).get("modular", "").lower(), "PSU"),
+                   lambda p: "fully modular" in p.get("attributes", _EMPTY).get("modular", "").lower(), "PSU"),
             Filter("semi_modular", "Semi-Modular", 
-                   lambda p: "semi" in p.get("attributes", {}).get("modular", "").lower(), "PSU"),
+                   lambda p: "semi" in p.get("attributes", _EMPTY).get("modular", "").lower(), "PSU"),
             Filter("non_modular", "Non-Modular", 
-                   lambda p: "non" in p.get("attributes", {}).get("modular", "").lower(), "PSU"),
+                   lambda p: "non" in p.get("attributes", _EMPTY).get("modular", "").lower(), "PSU"),
             Filter("650w", "650W+", 
-                   lambda p: p.get("attributes", {}).get("wattage", 0) >= 650, "PSU"),
+                   lambda p: p.get("attributes", _EMPTY).get("wattage", 0) >= 650, "PSU"),
             Filter("750w", "750W+", 
-                   lambda p: p.get("attributes", {}).get("wattage", 0) >= 750, "PSU"),
+                   lambda p: p.get("attributes", _EMPTY).get("wattage", 0) >= 750, "PSU"),
             Filter("850w", "850W+", 
-                   lambda p: p.get("attributes", {}).get("wattage", 0) >= 850, "PSU"),
+                   lambda p: p.get("attributes", _EMPTY).get("wattage", 0) >= 850, "PSU"),
             Filter("80plus_gold", "80+ Gold", 
-                   lambda p: "gold" in p.get("attributes", {}).get("efficiency", "").lower(), "PSU"),
+                   lambda p: "gold" in p.get("attributes", _EMPTY).get("efficiency", "").lower(), "PSU"),
             Filter("80plus_platinum", "80+ Platinum", 
-                   lambda p: "platinum" in p.get("attributes", {}).get("efficiency", "").lower(), "PSU"),
+                   lambda p: "platinum" in p.get("attributes", _EMPTY).get("efficiency", "").lower(), "PSU"),
         ]
     
     def _get_case_filters(self) -> List[Filter]:
         # Case-specific filters
         return [
             Filter("atx", "ATX Support", 
-                   lambda p: "ATX" in p.get("attributes", {}).get("form_factor", ""), "Case"),
+                   lambda p: "ATX" in p.get("attributes", _EMPTY).get("form_factor", ""), "Case"),
             Filter("micro_atx", "Micro-ATX Support", 
-                   lambda p: "Micro-ATX" in p.get("attributes", {}).get("form_factor", "") or "ATX" in p.get("attributes", {}).get("form_factor", ""), "Case"),
+                   lambda p: "Micro-ATX" in p.get("attributes", _EMPTY).get("form_factor", "") or "ATX" in p.get("attributes", _EMPTY).get("form_factor", ""), "Case"),
             Filter("mini_itx", "Mini-ITX Support", 
-                   lambda p: "Mini-ITX" in p.get("attributes", {}).get("form_factor", ""), "Case"),
+                   lambda p: "Mini-ITX" in p.get("attributes", _EMPTY).get("form_factor", ""), "Case"),
             Filter("tempered_glass", "Tempered Glass", 
                    lambda p: "glass" in p.get("name", "").lower() or "tg" in p.get("name", "").lower(), "Case"),
             Filter("rgb", "RGB Lighting", 
@@ -155,9 +204,9 @@ class ComponentFilters:
             Filter("hdd", "HDD", 
                    lambda p: "HDD" in p.get("name", ""), "Storage"),
             Filter("nvme", "NVMe", 
-                   lambda p: "NVMe" in p.get("attributes", {}).get("interface", ""), "Storage"),
+                   lambda p: "NVMe" in p.get("attributes", _EMPTY).get("interface", ""), "Storage"),
             Filter("sata", "SATA", 
-                   lambda p: "SATA" in p.get("attributes", {}).get("interface", ""), "Storage"),
+                   lambda p: "SATA" in p.get("attributes", _EMPTY).get("interface", ""), "Storage"),
             Filter("500gb", "500GB+", 
                    lambda p: self._parse_storage_capacity(p) >= 500, "Storage"),
             Filter("1tb", "1TB+", 
@@ -165,16 +214,16 @@ class ComponentFilters:
             Filter("2tb", "2TB+", 
                    lambda p: self._parse_storage_capacity(p) >= 2000, "Storage"),
             Filter("pcie4", "PCIe 4.0", 
-                   lambda p: "4.0" in p.get("attributes", {}).get("interface", "") or "Gen4" in p.get("name", ""), "Storage"),
+                   lambda p: "4.0" in p.get("attributes", _EMPTY).get("interface", "") or "Gen4" in p.get("name", ""), "Storage"),
         ]
     
     def _get_cooler_filters(self) -> List[Filter]:
         # CPU Cooler-specific filters
         return [
             Filter("air", "Air Cooler", 
-                   lambda p: "air" in p.get("attributes", {}).get("type", "").lower() or "tower" in p.get("name", "").lower(), "Cooler"),
+                   lambda p: "air" in p.get("attributes", _EMPTY).get("type", "").lower() or "tower" in p.get("name", "").lower(), "Cooler"),
             Filter("aio", "AIO Liquid", 
-                   lambda p: "aio" in p.get("attributes", {}).get("type", "").lower() or "liquid" in p.get("name", "").lower(), "Cooler"),
+                   lambda p: "aio" in p.get("attributes", _EMPTY).get("type", "").lower() or "liquid" in p.get("name", "").lower(), "Cooler"),
             Filter("120mm", "120mm", 
                    lambda p: "120mm" in p.get("name", ""), "Cooler"),
             Filter("240mm", "240mm+", 
@@ -187,15 +236,11 @@ class ComponentFilters:
     
     def _parse_ram_capacity(self, part: Dict) -> int:
         # Extract RAM capacity from name (e.g., '32GB (2x16GB)' -> 32)
-        import re
-        name = part.get("name", "")
-        match = re.search(r'(\d+)GB', name)
-        return int(match.group(1)) if match else 0
+        return _ram_capacity_from_name(part.get("name", ""))
     
     def _parse_storage_capacity(self, part: Dict) -> int:
         # Extract storage capacity in GB (handles both string '1TB' and int 500)
-        import re
-        capacity = part.get("attributes", {}).get("capacity", 0)
+        capacity = part.get("attributes", _EMPTY).get("capacity", 0)
         
         # If it's already an integer, return it
         if isinstance(capacity, int):
@@ -203,16 +248,7 @@ class ComponentFilters:
         
         # If it's a string, parse it
         if isinstance(capacity, str):
-            # Check for TB
-            if "TB" in capacity.upper():
-                match = re.search(r'(\d+)TB', capacity.upper())
-                if match:
-                    return int(match.group(1)) * 1000  # Convert TB to GB
-            # Check for GB
-            elif "GB" in capacity.upper():
-                match = re.search(r'(\d+)GB', capacity.upper())
-                if match:
-                    return int(match.group(1))
+            return _storage_capacity_from_text(capacity)
         
         return 0
     
@@ -225,20 +261,63 @@ class ComponentFilters:
         if not active_filters:
             return parts
         
-        category_filters = self.get_filters_for_category(category)
-        filter_map = {f.name: f for f in category_filters}
+        filter_map = self._filter_maps.get(category, _EMPTY)
+        active_funcs = [filter_map[fname].filter_func for fname in active_filters if fname in filter_map]
         
-        filtered_parts = []
-        for part in parts:
-            # Part must pass ALL active filters
-            if all(filter_map[fname].filter_func(part) for fname in active_filters if fname in filter_map):
-                filtered_parts.append(part)
+        # Part must pass ALL active filters. Each filter is run over the
+        # whole list in turn, so later filters only see the parts that are
+        # still left (same result and order as checking each part in full)
+        filtered_parts = parts
+        for filter_func in active_funcs:
+            filtered_parts = [part for part in filtered_parts if filter_func(part)]
         
+        if filtered_parts is parts:
+            return list(parts)  # No known filters - still hand back a new list
         return filtered_parts
 
 
+def _searchable_parts(parts: List[Dict]) -> List[Dict]:
+    # Parts the price searches can use - the same ones ComponentFactory
+    # could turn into Components (has id, name and price, known category)
+    is_known_category = ComponentFactory.is_known_category
+    return [
+        part for part in parts
+        if 'id' in part and 'name' in part and 'price' in part
+        and is_known_category(part.get('category'))
+    ]
+
+
+# Last price sort done by the price searches: (prices in list order, sort
+# order, sorted prices). It is matched on the prices themselves, so a list
+# that was edited in place is never given an out of date order
+_last_price_sort = None
+
+
+def _sorted_by_price(parts: List[Dict]) -> tuple:
+    # Searchable parts sorted by price, with their prices as a separate list
+    # Repeated searches over the same prices (e.g. autofill asking for several
+    # price points) reuse the last sort order instead of sorting again.
+    # Gathering the parts and prices is still done on every call (O(n)), so
+    # the result always reflects the dicts as they are now
+    global _last_price_sort
+    searchable = _searchable_parts(parts)
+    prices = tuple(part['price'] for part in searchable)
+    
+    cached = _last_price_sort
+    if cached is not None and cached[0] == prices:
+        order, sorted_prices = cached[1], cached[2]
+    else:
+        order = price_sort_order(prices)
+        sorted_prices = [prices[i] for i in order]
+        _last_price_sort = (prices, order, sorted_prices)
+    
+    return sorted_prices, [searchable[i] for i in order]
+
+
 def find_component_by_price(parts: List[Dict], target_price: float, use_binary_search: bool = True) -> Optional[Dict]:
     # Find component closest to target price using binary or linear search
+    # Works on the part dicts and their prices directly, so no Component
+    # objects are created (and turned back into dicts) on every call
     #
     # Time Complexity:
     # - Binary search: O(log n) if already sorted, O(n log n) if needs sorting
@@ -254,32 +333,20 @@ def find_component_by_price(parts: List[Dict], target_price: float, use_binary_s
     if not parts:
         return None
     
-    # Convert dicts to Component objects for algorithm
-    components = []
-    for part in parts:
-        try:
-            component = ComponentFactory.create_component(
-                part['id'], part['name'], part['category'],
-                part['price'], part.get('attributes', {})
-            )
-            components.append(component)
-        except Exception:
-            continue
+    if use_binary_search:
+        # Sort by price for binary search (the order is reused if the prices haven't changed)
+        sorted_prices, sorted_parts = _sorted_by_price(parts)
+        if not sorted_parts:
+            return None
+        return sorted_parts[binary_search_price_index(sorted_prices, target_price)]
     
-    if not components:
+    parts = _searchable_parts(parts)
+    if not parts:
         return None
     
-    if use_binary_search:
-        # Sort by price for binary search
-        sorted_components = sorted(components, key=lambda c: c.price)
-        result = binary_search_by_price(sorted_components, target_price)
-    else:
-        # Linear search on unsorted list
-        result = linear_search_by_price(components, target_price)
-    
-    if result:
-        return result.to_dict()
-    return None
+    # Linear search on unsorted list
+    prices = [part['price'] for part in parts]
+    return parts[linear_search_prices(prices, target_price)]
 
 
 def find_components_in_price_range(
@@ -306,22 +373,10 @@ def find_components_in_price_range(
         return []
     
     if use_binary_search:
-        # Convert to Component objects
-        components = []
-        for part in parts:
-            try:
-                component = ComponentFactory.create_component(
-                    part['id'], part['name'], part['category'],
-                    part['price'], part.get('attributes', {})
-                )
-                components.append(component)
-            except Exception:
-                continue
-        
-        # Sort and use binary search range
-        sorted_components = sorted(components, key=lambda c: c.price)
-        result_components = binary_search_range(sorted_components, min_price, max_price)
-        return [c.to_dict() for c in result_components]
+        # Sort the prices and use binary search range on them
+        sorted_prices, sorted_parts = _sorted_by_price(parts)
+        start, end = binary_search_range_prices(sorted_prices, min_price, max_price)
+        return sorted_parts[start:end]
     else:
         # Linear filtering (traditional approach)
         return [p for p in parts if min_price <= p['price'] <= max_price]
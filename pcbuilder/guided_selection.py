@@ -2,236 +2,165 @@
 # No technical knowledge required
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from .database_manager import get_database_manager
 from .filters import component_filters
-from .merge_sort import merge_sort_parts_by_price
 
 
-class GuidedSelector:
-    # Guided component selector with question-based filtering
+# User-friendly questions for each component category. Built once when the
+# module is imported rather than every time a guided selection dialog opens
+# Each question is (question text, options) and each option is
+# (option text, filter names). Tuples keep this shared table read-only
+Question = Tuple[str, Tuple[Tuple[str, Tuple[str, ...]], ...]]
+_QUESTIONS: Dict[str, Tuple[Question, ...]] = {
+    "CPU": (
+        ("What will you primarily use this PC for?", (
+            ("Gaming", ("6_cores",)),
+            ("Video Editing / 3D Work", ("8_cores",)),
+            ("High-End Workstation", ("12_cores",)),
+            ("Office Work / Browsing", ())
+        )),
+        ("Do you plan to overclock (push performance beyond factory settings)?", (
+            ("Yes, I want maximum performance", ("unlocked",)),
+            ("No, standard performance is fine", ())
+        )),
+        ("Do you need a dedicated graphics card, or will you use integrated graphics?", (
+            ("I'm buying a separate graphics card", ()),
+            ("I'll use integrated graphics (no separate GPU)", ("integrated_gpu",))
+        ))
+    ),
     
-    def __init__(self):
-        self.questions = self._initialize_questions()
+    "Motherboard": (
+        ("What size case do you prefer?", (
+            ("Full size (most expandable)", ("atx",)),
+            ("Compact (smaller desk footprint)", ("micro_atx",)),
+            ("Mini (very small, portable)", ("mini_itx",))
+        )),
+        ("Do you need built-in WiFi?", (
+            ("Yes, I'll connect wirelessly", ("wifi",)),
+            ("No, I'll use ethernet cable", ())
+        )),
+        ("Which type of RAM do you prefer?", (
+            ("Latest generation (DDR5 - faster, more expensive)", ("ddr5",)),
+            ("Current generation (DDR4 - good value)", ("ddr4",)),
+            ("Either is fine", ())
+        ))
+    ),
     
-    def _initialize_questions(self) -> Dict[str, List[Dict]]:
-        # Initialize user-friendly questions for each component
-        return {
-            "CPU": [
-                {
-                    "question": "What will you primarily use this PC for?",
-                    "options": {
-                        "Gaming": ["6_cores"],
-                        "Video Editing / 3D Work": ["8_cores"],
-                        "High-End Workstation": ["12_cores"],
-                        "Office Work / Browsing": []
-                    }
-                },
-                {
-                    "question": "Do you plan to overclock (push performance beyond factory settings)?",
-                    "options": {
-                        "Yes, I want maximum performance": ["unlocked"],
-                        "No, standard performance is fine": []
-                    }
-                },
-                {
-                    "question": "Do you need a dedicated graphics card, or will you use integrated graphics?",
-                    "options": {
-                        "I'm buying a separate graphics card": [],
-                        "I'll use integrated graphics (no separate GPU)": ["integrated_gpu"]
-                    }
-                }
-            ],
-            
-            "Motherboard": [
-                {
-                    "question": "What size case do you prefer?",
-                    "options": {
-                        "Full size (most expandable)": ["atx"],
-                        "Compact (smaller desk footprint)": ["micro_atx"],
-                        "Mini (very small, portable)": ["mini_itx"]
-                    }
-                },
-                {
-                    "question": "Do you need built-in WiFi?",
-                    "options": {
-                        "Yes, I'll connect wirelessly": ["wifi"],
-                        "No, I'll use ethernet cable": []
-                    }
-                },
-                {
-                    "question": "Which type of RAM do you prefer?",
-                    "options": {
-                        "Latest generation (DDR5 - faster, more expensive)": ["ddr5"],
-                        "Current generation (DDR4 - good value)": ["ddr4"],
-                        "Either is fine": []
-                    }
-                }
-            ],
-            
-            "RAM": [
-                {
-                    "question": "What will you use this PC for?",
-                    "options": {
-                        "Gaming only": ["16gb"],
-                        "Gaming + Multitasking": ["32gb"],
-                        "Content Creation / Heavy Workloads": ["32gb"],
-                        "Basic use (browsing, office)": []
-                    }
-                },
-                {
-                    "question": "Which generation do you want?",
-                    "options": {
-                        "Latest (DDR5 - faster)": ["ddr5"],
-                        "Current (DDR4 - better value)": ["ddr4"]
-                    }
-                },
-                {
-                    "question": "Do you want RGB lighting?",
-                    "options": {
-                        "Yes, I love RGB!": ["rgb"],
-                        "No, just performance": []
-                    }
-                }
-            ],
-            
-            "GPU": [
-                {
-                    "question": "What resolution will you game at?",
-                    "options": {
-                        "1080p (Full HD)": ["8gb_vram"],
-                        "1440p (2K)": ["12gb_vram"],
-                        "4K (Ultra HD)": ["16gb_vram"],
-                        "Not for gaming": []
-                    }
-                },
-                {
-                    "question": "Which brand do you prefer?",
-                    "options": {
-                        "NVIDIA (DLSS, ray tracing)": ["nvidia"],
-                        "AMD (good value)": ["amd"],
-                        "No preference": []
-                    }
-                },
-                {
-                    "question": "Do you want ray tracing support (realistic lighting)?",
-                    "options": {
-                        "Yes, I want the best graphics": ["ray_tracing"],
-                        "No, standard graphics are fine": []
-                    }
-                }
-            ],
-            
-            "PSU": [
-                {
-                    "question": "What's your build type?",
-                    "options": {
-                        "Budget build (basic components)": ["650w"],
-                        "Mid-range gaming": ["750w"],
-                        "High-end / enthusiast": ["850w"]
-                    }
-                },
-                {
-                    "question": "How important is cable management?",
-                    "options": {
-                        "Very important (clean look)": ["modular"],
-                        "Somewhat important": ["semi_modular"],
-                        "Not important": ["non_modular"]
-                    }
-                },
-                {
-                    "question": "How efficient should it be?",
-                    "options": {
-                        "Very efficient (lower electricity bills)": ["80plus_platinum"],
-                        "Standard efficiency": ["80plus_gold"],
-                        "Basic": []
-                    }
-                }
-            ],
-            
-            "Case": [
-                {
-                    "question": "What size case do you want?",
-                    "options": {
-                        "Full size (most room)": ["atx"],
-                        "Medium (good balance)": ["micro_atx"],
-                        "Small (compact)": ["mini_itx"]
-                    }
-                },
-                {
-                    "question": "Do you want a glass side panel to show off your build?",
-                    "options": {
-                        "Yes, tempered glass": ["tempered_glass"],
-                        "No, solid panel is fine": []
-                    }
-                },
-                {
-                    "question": "What's more important to you?",
-                    "options": {
-                        "Best airflow (cooler, quieter)": ["mesh"],
-                        "RGB lighting (looks cool)": ["rgb"],
-                        "Both are fine": []
-                    }
-                }
-            ],
-            
-            "Storage": [
-                {
-                    "question": "What's your primary use?",
-                    "options": {
-                        "Operating system + programs": ["ssd", "nvme", "500gb"],
-                        "Gaming library": ["ssd", "1tb"],
-                        "Large file storage": ["2tb"],
-                        "Budget mass storage": ["hdd", "2tb"]
-                    }
-                },
-                {
-                    "question": "How fast do you need it?",
-                    "options": {
-                        "Fastest possible (for OS/games)": ["nvme", "pcie4"],
-                        "Fast enough": ["ssd"],
-                        "Storage space over speed": ["hdd"]
-                    }
-                },
-                {
-                    "question": "How much storage do you need?",
-                    "options": {
-                        "500GB - 1TB": ["500gb"],
-                        "1TB - 2TB": ["1tb"],
-                        "2TB+": ["2tb"]
-                    }
-                }
-            ],
-            
-            "Cooler": [
-                {
-                    "question": "What type of cooler do you prefer?",
-                    "options": {
-                        "Air cooler (reliable, quiet)": ["air"],
-                        "Liquid cooler (better cooling, looks cool)": ["aio"]
-                    }
-                },
-                {
-                    "question": "How powerful is your CPU?",
-                    "options": {
-                        "Budget / Mid-range": ["120mm"],
-                        "High-end / Gaming": ["240mm"],
-                        "Enthusiast / Overclocked": ["240mm"]
-                    }
-                },
-                {
-                    "question": "Do you want RGB lighting?",
-                    "options": {
-                        "Yes, RGB all the things!": ["rgb"],
-                        "No, just cooling performance": ["quiet"]
-                    }
-                }
-            ]
-        }
+    "RAM": (
+        ("What will you use this PC for?", (
+            ("Gaming only", ("16gb",)),
+            ("Gaming + Multitasking", ("32gb",)),
+            ("Content Creation / Heavy Workloads", ("32gb",)),
+            ("Basic use (browsing, office)", ())
+        )),
+        ("Which generation do you want?", (
+            ("Latest (DDR5 - faster)", ("ddr5",)),
+            ("Current (DDR4 - better value)", ("ddr4",))
+        )),
+        ("Do you want RGB lighting?", (
+            ("Yes, I love RGB!", ("rgb",)),
+            ("No, just performance", ())
+        ))
+    ),
+    
+    "GPU": (
+        ("What resolution will you game at?", (
+            ("1080p (Full HD)", ("8gb_vram",)),
+            ("1440p (2K)", ("12gb_vram",)),
+            ("4K (Ultra HD)", ("16gb_vram",)),
+            ("Not for gaming", ())
+        )),
+        ("Which brand do you prefer?", (
+            ("NVIDIA (DLSS, ray tracing)", ("nvidia",)),
+            ("AMD (good value)", ("amd",)),
+            ("No preference", ())
+        )),
+        ("Do you want ray tracing support (realistic lighting)?", (
+            ("Yes, I want the best graphics", ("ray_tracing",)),
+            ("No, standard graphics are fine", ())
+        ))
+    ),
+    
+    "PSU": (
+        ("What's your build type?", (
+            ("Budget build (basic components)", ("650w",)),
+            ("Mid-range gaming", ("750w",)),
+            ("High-end / enthusiast", ("850w",))
+        )),
+        ("How important is cable management?", (
+            ("Very important (clean look)", ("modular",)),
+            ("Somewhat important", ("semi_modular",)),
+            ("Not important", ("non_modular",))
+        )),
+        ("How efficient should it be?", (
+            ("Very efficient (lower electricity bills)", ("80plus_platinum",)),
+            ("Standard efficiency", ("80plus_gold",)),
+            ("Basic", ())
+        ))
+    ),
+    
+    "Case": (
+        ("What size case do you want?", (
+            ("Full size (most room)", ("atx",)),
+            ("Medium (good balance)", ("micro_atx",)),
+            ("Small (compact)", ("mini_itx",))
+        )),
+        ("Do you want a glass side panel to show off your build?", (
+            ("Yes, tempered glass", ("tempered_glass",)),
+            ("No, solid panel is fine", ())
+        )),
+        ("What's more important to you?", (
+            ("Best airflow (cooler, quieter)", ("mesh",)),
+            ("RGB lighting (looks cool)", ("rgb",)),
+            ("Both are fine", ())
+        ))
+    ),
+    
+    "Storage": (
+        ("What's your primary use?", (
+            ("Operating system + programs", ("ssd", "nvme", "500gb")),
+            ("Gaming library", ("ssd", "1tb")),
+            ("Large file storage", ("2tb",)),
+            ("Budget mass storage", ("hdd", "2tb"))
+        )),
+        ("How fast do you need it?", (
+            ("Fastest possible (for OS/games)", ("nvme", "pcie4")),
+            ("Fast enough", ("ssd",)),
+            ("Storage space over speed", ("hdd",))
+        )),
+        ("How much storage do you need?", (
+            ("500GB - 1TB", ("500gb",)),
+            ("1TB - 2TB", ("1tb",)),
+            ("2TB+", ("2tb",))
+        ))
+    ),
+    
+    "Cooler": (
+        ("What type of cooler do you prefer?", (
+            ("Air cooler (reliable, quiet)", ("air",)),
+            ("Liquid cooler (better cooling, looks cool)", ("aio",))
+        )),
+        ("How powerful is your CPU?", (
+            ("Budget / Mid-range", ("120mm",)),
+            ("High-end / Gaming", ("240mm",)),
+            ("Enthusiast / Overclocked", ("240mm",))
+        )),
+        ("Do you want RGB lighting?", (
+            ("Yes, RGB all the things!", ("rgb",)),
+            ("No, just cooling performance", ("quiet",))
+        ))
+    )
+}
+
+
+class GuidedSelector:
+    # Guided component selector with question-based filtering
     
-    def get_questions(self, category: str) -> List[Dict]:
+    @staticmethod
+    def get_questions(category: str) -> Tuple[Question, ...]:
         # Get questions for a specific component category
-        return self.questions.get(category, [])
+        return _QUESTIONS.get(category, ())
 
 
 class GuidedSelectorDialog(tk.Toplevel):
@@ -242,9 +171,9 @@ class GuidedSelectorDialog(tk.Toplevel):
         
         self.category = category
         self.on_select_callback = on_select_callback
-        self.guided_selector = GuidedSelector()
         self.answers = {}
         self.active_filters = []
+        self._category_parts_cache = None  # This category's parts, read on first use
         
         self.title(f"Choose {category} - Guided Selection")
         self.geometry("700x600")
@@ -312,7 +241,7 @@ class GuidedSelectorDialog(tk.Toplevel):
     
     def _build_questions(self):
         # Build the question interface
-        questions = self.guided_selector.get_questions(self.category)
+        questions = GuidedSelector.get_questions(self.category)
         
         if not questions:
             ttk.Label(self.questions_frame,
@@ -320,7 +249,7 @@ class GuidedSelectorDialog(tk.Toplevel):
                      font=("Arial", 10)).pack(pady=20)
             return
         
-        for i, q in enumerate(questions, start=1):
+        for i, (question_text, options) in enumerate(questions, start=1):
             # Question frame
             q_frame = ttk.LabelFrame(self.questions_frame, 
                                      text=f"Question {i}",
@@ -329,15 +258,15 @@ class GuidedSelectorDialog(tk.Toplevel):
             
             # Question text
             ttk.Label(q_frame,
-                     text=q["question"],
+                     text=question_text,
                      font=("Arial", 10, "bold"),
                      wraplength=600).pack(anchor="w", pady=(0, 10))
             
             # Options
             var = tk.StringVar(value="")
-            self.answers[i] = {"var": var, "filters_map": q["options"]}
+            self.answers[i] = {"var": var, "options": options}
             
-            for option_text in q["options"].keys():
+            for option_text, _filters in options:
                 rb = ttk.Radiobutton(q_frame,
                                     text=option_text,
                                     variable=var,
@@ -349,25 +278,34 @@ class GuidedSelectorDialog(tk.Toplevel):
         for answer_data in self.answers.values():
             answer_data["var"].set("")
     
+    def _category_parts(self) -> List[Dict]:
+        # All parts for this category, looked up once per dialog and reused by
+        # _show_results and "Show All Components". The list is shared with the
+        # database manager's cache, so it is only ever read here
+        if self._category_parts_cache is None:
+            db = get_database_manager()
+            self._category_parts_cache = db.get_component_dicts_by_category(self.category)
+        return self._category_parts_cache
+    
     def _show_results(self):
         # Show filtered results based on answers
-        # Collect active filters
-        self.active_filters = []
+        # Collect active filters (dict keys drop duplicates but, unlike a set,
+        # keep the filters in question order)
+        active_filters = {}
         
         for answer_data in self.answers.values():
             selected = answer_data["var"].get()
             if selected:
-                filters = answer_data["filters_map"].get(selected, [])
-                self.active_filters.extend(filters)
+                # At most four options per question, so a scan finds the answer
+                for option_text, filters in answer_data["options"]:
+                    if option_text == selected:
+                        active_filters.update(dict.fromkeys(filters))
+                        break
         
-        # Remove duplicates
-        self.active_filters = list(set(self.active_filters))
+        self.active_filters = list(active_filters)
         
         # Get all parts for this category
-        db = get_database_manager()
-        components = db.get_all_components()
-        all_parts = [comp.to_dict() for comp in components]
-        category_parts = [p for p in all_parts if p["category"] == self.category]
+        category_parts = self._category_parts()
         
         # Apply filters
         if self.active_filters:
@@ -440,32 +378,33 @@ class GuidedSelectorDialog(tk.Toplevel):
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
         tree.configure(yscrollcommand=scrollbar.set)
         
-        # Store original parts list
-        current_parts = parts.copy()
-        
-        # Function to populate tree with current parts list
-        def populate_tree(parts_list):
-            # Clear existing items
-            for item in tree.get_children():
-                tree.delete(item)
-            
-            # Add parts to tree
-            for part in parts_list:
-                tree.insert("", tk.END, values=(
-                    part["name"],
-                    f"£{part['price']:.2f}"
-                ), tags=(part["id"],))
-        
-        # Initially populate with unsorted parts
-        populate_tree(current_parts)
+        # Parts by ID, so selecting one is a dict lookup rather than a scan
+        parts_by_id = {part["id"]: part for part in parts}
+        prices = [part["price"] for part in parts]
+        
+        # Add every part to the tree once, in the original (unsorted) order
+        # item_ids[i] is the tree row for parts[i]
+        item_ids = [
+            tree.insert("", tk.END, values=(
+                part["name"],
+                f"£{part['price']:.2f}"
+            ), tags=(part["id"],))
+            for part in parts
+        ]
+        
+        # Function to show the parts in a new order (a list of indexes into parts)
+        def reorder_tree(order):
+            # Move the existing rows rather than deleting and inserting them all
+            for position, index in enumerate(order):
+                tree.move(item_ids[index], "", position)
         
         # Sort button handler
         def sort_by_price():
-            nonlocal current_parts
-            
+            # Sorting indexes by price is stable like sorting the parts, so
+            # parts with equal prices stay in their original order
             if sort_state["ascending"] is None:
                 # First click: Sort ascending (low to high)
-                current_parts = merge_sort_parts_by_price(parts, ascending=True)
+                order = sorted(range(len(prices)), key=prices.__getitem__)
                 sort_state["ascending"] = True
                 sort_label.config(
                     text="Sorted by price: Low → High",
@@ -473,7 +412,7 @@ class GuidedSelectorDialog(tk.Toplevel):
                 )
             elif sort_state["ascending"] is True:
                 # Second click: Sort descending (high to low)
-                current_parts = merge_sort_parts_by_price(parts, ascending=False)
+                order = sorted(range(len(prices)), key=prices.__getitem__, reverse=True)
                 sort_state["ascending"] = False
                 sort_label.config(
                     text="Sorted by price: High → Low",
@@ -481,15 +420,15 @@ class GuidedSelectorDialog(tk.Toplevel):
                 )
             else:
                 # Third click: Reset to unsorted
-                current_parts = parts.copy()
+                order = range(len(prices))
                 sort_state["ascending"] = None
                 sort_label.config(
                     text="Not sorted",
                     foreground="#666"
                 )
             
-            # Repopulate tree with sorted list
-            populate_tree(current_parts)
+            # Put the tree rows in the new order
+            reorder_tree(order)
         
         # Sort button
         sort_btn = ttk.Button(sort_frame, 
@@ -515,7 +454,7 @@ class GuidedSelectorDialog(tk.Toplevel):
             part_id = tree.item(item)["tags"][0]
             
             # Find the part
-            selected_part = next((p for p in parts if p["id"] == part_id), None)
+            selected_part = parts_by_id.get(part_id)
             
             if selected_part:
                 self.on_select_callback(selected_part)
@@ -524,12 +463,8 @@ class GuidedSelectorDialog(tk.Toplevel):
         
         def show_all():
             # Show all components without filters
-            db = get_database_manager()
-            components = db.get_all_components()
-            all_parts = [comp.to_dict() for comp in components]
-            category_parts = [p for p in all_parts if p["category"] == self.category]
             results_dialog.destroy()
-            self._show_results_dialog(category_parts)
+            self._show_results_dialog(self._category_parts())
         
         ttk.Button(btn_frame, text="Select",
                   command=select_part).pack(side="right", padx=5)
@@ -547,7 +482,3 @@ class GuidedSelectorDialog(tk.Toplevel):
         # Grab focus after everything is created
         results_dialog.update_idletasks()
         results_dialog.grab_set()
-
-
-# Global instance
-guided_selector = GuidedSelector()
@@ -301,6 +301,12 @@ class ComponentFactory:
         'Cooler': Cooler
     }
     
+    # Attributes the compatibility checks compare as whole numbers
+    _numeric_attributes = frozenset({
+        'wattage', 'power_draw', 'length_mm', 'max_gpu_length_mm',
+        'memory_slots', 'sticks'
+    })
+    
     @classmethod
     def create_component(cls, component_id: str, name: str, category: str, 
                         price: float, attributes: Dict[str, Any]) -> Component:
@@ -308,7 +314,30 @@ class ComponentFactory:
         component_class = cls._component_map.get(category)
         if component_class is None:
             raise ValueError(f"Unknown component category: {category}")
-        return component_class(component_id, name, price, attributes)
+        return component_class(component_id, name, price, cls.convert_numeric_attributes(attributes))
+    
+    @classmethod
+    def is_known_category(cls, category: str) -> bool:
+        # Check if the factory can create components of this category
+        return category in cls._component_map
+    
+    @classmethod
+    def convert_numeric_attributes(cls, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        # Turn numeric attributes stored as text (e.g. "4") into ints once, when the
+        # component is loaded, so later checks don't have to parse them every time
+        # Values that aren't numbers are left alone
+        converted = None
+        for key in cls._numeric_attributes.intersection(attributes):
+            value = attributes[key]
+            if isinstance(value, str):
+                try:
+                    number = int(value)
+                except ValueError:
+                    continue
+                if converted is None:
+                    converted = dict(attributes)
+                converted[key] = number
+        return attributes if converted is None else converted
 
 
 class Build:
@@ -332,6 +361,10 @@ class Build:
         }
         self.__created_at: datetime = datetime.now()
         self.__share_key: Optional[str] = None
+        # Results worked out from the components, kept until the parts change
+        # __version goes up on every change so stale results are never reused
+        self.__version: int = 0
+        self.__cache: Dict[str, Any] = {}
     
     @property
     def build_id(self) -> Optional[int]:
@@ -374,11 +407,27 @@ class Build:
         # Add a component to the build
         category = component.get_category().value
         self.__components[category] = component
+        self.__parts_changed()
     
     def remove_component(self, category: str) -> None:
         # Remove a component from the build
         if category in self.__components:
             self.__components[category] = None
+            self.__parts_changed()
+    
+    def __parts_changed(self) -> None:
+        # Forget cached results after the components change
+        self.__version += 1
+        self.__cache.clear()
+    
+    def __cached(self, key: str, compute):
+        # Return a cached result for the current parts, computing it if needed
+        entry = self.__cache.get(key)
+        if entry is not None and entry[0] == self.__version:
+            return entry[1]
+        value = compute()
+        self.__cache[key] = (self.__version, value)
+        return value
     
     def get_component(self, category: str) -> Optional[Component]:
         # Get a component by category
@@ -389,8 +438,11 @@ class Build:
         return self.__components.copy()
     
     def calculate_total_price(self) -> float:
-        # Calculate total price of all components
-        return sum(comp.price for comp in self.__components.values() if comp is not None)
+        # Calculate total price of all components (cached until the parts change)
+        return self.__cached(
+            'total_price',
+            lambda: sum(comp.price for comp in self.__components.values() if comp is not None)
+        )
     
     def calculate_total_wattage(self) -> int:
         # Calculate total power consumption
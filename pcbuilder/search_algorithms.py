@@ -1,5 +1,6 @@
 # Search Algorithms Module
 # Demonstrates different search algorithms with time complexity analysis
+from bisect import bisect_left, bisect_right
 from typing import List, Optional, Tuple, Callable
 from .models import Component
 
@@ -205,6 +206,173 @@ def linear_search_by_price(components: List[Component], target_price: float) ->
     return closest
 
 
+def extract_prices(components: List[Component]) -> List[float]:
+    # Copy component prices into a flat list (Structure of Arrays layout)
+    # The *_prices searches below then compare plain floats instead of
+    # looking up .price on a Component object at every step
+    #
+    # Time Complexity: O(n) - done once, then reused for every search
+    #
+    # Args:
+    # components: List of components (keep the same order for index lookups)
+    #
+    # Returns:
+    # List of prices where prices[i] == components[i].price
+    return [component.price for component in components]
+
+
+def price_sort_order(prices: List[float]) -> List[int]:
+    # Indices that put a list of prices into ascending order (argsort)
+    # Sorting the indices by prices.__getitem__ avoids calling a lambda
+    # that reads .price from a Component for every element
+    #
+    # Time Complexity: O(n log n)
+    # Space Complexity: O(n)
+    #
+    # Args:
+    # prices: List of prices (any order)
+    #
+    # Returns:
+    # List of indices so that [prices[i] for i in order] is sorted
+    return sorted(range(len(prices)), key=prices.__getitem__)
+
+
+def binary_search_prices(prices: List[float], target_price: float) -> int:
+    # Binary search on a sorted list of prices (see extract_prices)
+    # Uses bisect (implemented in C) to find where the target would be
+    # inserted, then picks the closer of the two neighbouring prices
+    #
+    # Ties are resolved differently from binary_search_by_price:
+    # - duplicate prices: returns the first (lowest index) of them
+    # - target exactly between two prices: returns the lower one
+    # binary_search_by_price follows its midpoint probes instead, so it can
+    # return a different one of several equal prices. Use
+    # binary_search_price_index for the same result as binary_search_by_price
+    #
+    # Time Complexity: O(log n)
+    # Space Complexity: O(1)
+    #
+    # Args:
+    # prices: Sorted list of prices (ascending)
+    # target_price: Price to search for
+    #
+    # Returns:
+    # Index of the price closest to target, or -1 if the list is empty
+    if not prices:
+        return -1
+    
+    index = bisect_left(prices, target_price)
+    
+    # Target is above every price - the last one is closest
+    if index == len(prices):
+        return index - 1
+    
+    # Exact match, or target is below every price
+    if index == 0 or prices[index] == target_price:
+        return index
+    
+    # Otherwise compare the prices either side of the insertion point
+    if target_price - prices[index - 1] <= prices[index] - target_price:
+        return index - 1
+    return index
+
+
+def binary_search_price_index(prices: List[float], target_price: float) -> int:
+    # Binary search on a sorted list of prices that returns the same position
+    # as binary_search_by_price would on the matching component list
+    # It checks the same midpoints in the same order, so duplicate prices and
+    # targets exactly between two prices resolve to the same element
+    # (binary_search_prices can pick a different one of equal prices)
+    #
+    # Time Complexity: O(log n)
+    # Space Complexity: O(1)
+    #
+    # Args:
+    # prices: Sorted list of prices (ascending)
+    # target_price: Price to search for
+    #
+    # Returns:
+    # Index of the price closest to target, or -1 if the list is empty
+    if not prices:
+        return -1
+    
+    if len(prices) == 1:
+        return 0
+    
+    left = 0
+    right = len(prices) - 1
+    
+    # Closest price seen so far - only a strictly smaller difference replaces it
+    closest = 0
+    min_diff = abs(prices[0] - target_price)
+    
+    while left <= right:
+        mid = (left + right) // 2
+        current_price = prices[mid]
+        current_diff = abs(current_price - target_price)
+        
+        if current_diff < min_diff:
+            min_diff = current_diff
+            closest = mid
+        
+        if current_price == target_price:
+            return mid
+        elif current_price < target_price:
+            left = mid + 1
+        else:
+            right = mid - 1
+    
+    return closest
+
+
+def binary_search_range_prices(prices: List[float], min_price: float, max_price: float) -> Tuple[int, int]:
+    # Binary search for the slice of a sorted price list within a range
+    # Index-based version of binary_search_range using bisect
+    #
+    # Time Complexity: O(log n)
+    # Space Complexity: O(1)
+    #
+    # Args:
+    # prices: Sorted list of prices (ascending)
+    # min_price: Minimum price (inclusive)
+    # max_price: Maximum price (inclusive)
+    #
+    # Returns:
+    # (start, end) so that sorted_components[start:end] are all in range
+    if not prices or min_price > max_price:
+        return 0, 0
+    
+    # First index with price >= min_price, first index with price > max_price
+    start = bisect_left(prices, min_price)
+    end = bisect_right(prices, max_price, start)
+    
+    return start, end
+
+
+def linear_search_prices(prices: List[float], target_price: float) -> int:
+    # Linear search on a list of prices (any order)
+    # Index-based version of linear_search_by_price
+    #
+    # Time Complexity: O(n)
+    # Space Complexity: O(1)
+    #
+    # Returns:
+    # Index of the price closest to target, or -1 if the list is empty
+    if not prices:
+        return -1
+    
+    closest = 0
+    min_diff = abs(prices[0] - target_price)
+    
+    for index, price in enumerate(prices):
+        diff = abs(price - target_price)
+        if diff < min_diff:
+            min_diff = diff
+            closest = index
+    
+    return closest
+
+
 def compare_search_algorithms(components: List[Component], target_price: float) -> dict:
     # Compare binary search vs linear search performance
     # Demonstrates algorithmic complexity analysis
@@ -96,9 +96,7 @@ def load_template_build(template_id: str) -> Optional[Dict[str, Optional[dict]]]
     
     # Get all parts from database
     db = get_database_manager()
-    components = db.get_all_components()
-    all_parts = [comp.to_dict() for comp in components]
-    parts_by_name = {part['name']: part for part in all_parts}
+    parts_by_name = {part['name']: part for part in db.get_all_component_dicts()}
     
     # Build the selected_parts dictionary
     selected_parts = {
@@ -112,14 +110,21 @@ def load_template_build(template_id: str) -> Optional[Dict[str, Optional[dict]]]
         'Cooler': None
     }
     
+    # Group (lowercase name, part) pairs by category once, so a partial match
+    # only scans parts of the right category instead of the whole catalogue
+    parts_by_category = {}
+    for name, part in parts_by_name.items():
+        parts_by_category.setdefault(part['category'], []).append((name.lower(), part))
+    
     # Resolve template component names to actual parts
     for category, part_name in template.components.items():
         if part_name in parts_by_name:
             selected_parts[category] = parts_by_name[part_name]
         else:
             # Try partial match if exact match not found
-            for name, part in parts_by_name.items():
-                if part_name.lower() in name.lower() and part['category'] == category:
+            wanted = part_name.lower()
+            for name, part in parts_by_category.get(category, []):
+                if wanted in name:
                     selected_parts[category] = part
                     break
     
@@ -13,8 +13,7 @@ import math
 def list_parts():
     # Get all components as dictionaries
     db = get_database_manager()
-    components = db.get_all_components()
-    return [comp.to_dict() for comp in components]
+    return list(db.get_all_component_dicts())
 
 
 def save_build(user_id: int, build_name: str, parts: dict):
@@ -871,10 +870,8 @@ class BuilderTab(ttk.Frame):
         self.parts_by_category = {}
         
         for part in self.all_parts:
-            category = part["category"]
-            if category not in self.parts_by_category:
-                self.parts_by_category[category] = []
-            self.parts_by_category[category].append(part)
+            # setdefault finds or creates the category's list in one lookup
+            self.parts_by_category.setdefault(part["category"], []).append(part)
         
         # Update save button based on user permissions
         current_user = session.get_current_user()
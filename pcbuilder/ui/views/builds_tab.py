@@ -6,17 +6,11 @@ from ...compat import run_full_check
 from ...templates import get_template_builds, get_template_summary
 
 
-def load_user_builds(user_id: int):
-    # Load all builds for a user
+def load_user_build_summaries(user_id: int):
+    # Load the id, name, date, share key, part count and total of each build
+    # (enough for the builds list, without loading every component)
     db = get_database_manager()
-    builds = db.load_user_builds(user_id)
-    result = []
-    for build in builds:
-        build_dict = build.to_dict()
-        if 'components' in build_dict:
-            build_dict['parts'] = build_dict.pop('components')
-        result.append(build_dict)
-    return result
+    return db.load_user_build_summaries(user_id)
 
 
 def load_build_by_id(build_id: int):
@@ -146,20 +140,16 @@ class BuildsTab(ttk.Frame):
         if not self.controller.current_user_id:
             return
         
-        # Load builds
-        builds = load_user_builds(self.controller.current_user_id)
+        # Load builds (summaries only - a build's parts are loaded when it is opened)
+        builds = load_user_build_summaries(self.controller.current_user_id)
         
         for build in builds:
-            parts = build.get("parts", {})
-            parts_count = sum(1 for p in parts.values() if p is not None)
-            total_price = sum(p.get("price", 0) for p in parts.values() if p is not None)
-            
             self.builds_tree.insert("", tk.END, values=(
                 build["id"],
                 build["name"],
                 build["created_at"][:19],  # Trim microseconds
-                parts_count,
-                f"£{total_price:.2f}",
+                build["parts_count"],
+                f"£{build['total_price']:.2f}",
                 build.get("share_key", "N/A")
             ))
     